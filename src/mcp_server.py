@@ -1,8 +1,10 @@
 from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
+import asyncio
 import sys
-from typing import Any
+from typing import Any, Callable, Optional
 import re
 import time
 
@@ -21,6 +23,7 @@ import json
 import httpx
 from dotenv import load_dotenv
 from datetime import datetime
+from urllib.parse import urlencode
 
 api = FastAPI()
 
@@ -78,19 +81,30 @@ def _terminal_log(label: str, payload: Any = None) -> None:
 		print(str(payload))
 
 
+# (config.json mtime_ns, parsed llm settings); re-parsed only when the settings manager rewrites the file
+_LLM_CONFIG_CACHE: Optional[tuple[int, dict[str, Any]]] = None
+
+
 def _load_runtime_llm_config() -> dict[str, Any]:
-	"""Load llm settings from config.json."""
+	"""Load llm settings from config.json, reusing the last parse while the file is unchanged."""
+	global _LLM_CONFIG_CACHE
 	default_cfg: dict[str, Any] = {"model": "groq", "timeout": 30.0}
 	try:
-		if CONFIG_PATH.exists():
-			with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-				cfg = json.load(f)
-			llm_cfg = cfg.get("llm", {})
-			if isinstance(llm_cfg, dict):
-				default_cfg.update(llm_cfg)
+		mtime_ns = CONFIG_PATH.stat().st_mtime_ns
+	except OSError:
+		return default_cfg
+	cached = _LLM_CONFIG_CACHE
+	if cached is not None and cached[0] == mtime_ns:
+		return dict(cached[1])
+	try:
+		cfg = json.loads(CONFIG_PATH.read_bytes())
+		llm_cfg = cfg.get("llm", {})
+		if isinstance(llm_cfg, dict):
+			default_cfg.update(llm_cfg)
+		_LLM_CONFIG_CACHE = (mtime_ns, default_cfg)
 	except Exception as e:
 		_terminal_log("Config load warning", {"error": str(e)})
-	return default_cfg
+	return dict(default_cfg)
 
 
 def _create_llm_client(system_prompt: str):
@@ -530,7 +544,6 @@ async def execute_tool(tool_name: str, parameters: dict, base_url: str) -> Any:
 				if not city:
 					return {"error": "City parameter is required for weather info"}
 				
-				from urllib.parse import urlencode
 				params = urlencode({"city": city, "days": days, "formatted": formatted})
 				resp = await client.get(f"{base_url}/tools/weather?{params}")
 				return resp.json()
@@ -544,7 +557,6 @@ async def execute_tool(tool_name: str, parameters: dict, base_url: str) -> Any:
 				if not query:
 					return {"error": "Query parameter is required for search"}
 				
-				from urllib.parse import urlencode
 				params = urlencode({"query": query, "max_results": max_results, "formatted": formatted, "region": region})
 				resp = await client.get(f"{base_url}/tools/search?{params}")
 				return resp.json()
@@ -562,8 +574,53 @@ async def execute_tool(tool_name: str, parameters: dict, base_url: str) -> Any:
 
 @api.post("/gemini_chat")
 async def gemini_chat(request: Request):
-	"""Handle chat responses with session-based tool orchestration."""
+	"""Handle chat responses with session-based tool orchestration.
+
+	With ``"stream": true`` in the body the reply is sent as NDJSON: one
+	``{"type": "progress", "text": ...}`` line per visible message as soon as the
+	model produces it, then a ``{"type": "final", ...}`` line with the usual payload.
+	"""
 	data = await request.json()
+	base_url = str(request.base_url).rstrip("/")
+	if not data.get("stream"):
+		return await _run_chat_session(data, base_url)
+
+	queue: asyncio.Queue = asyncio.Queue()
+
+	async def _produce() -> None:
+		try:
+			payload = await _run_chat_session(
+				data, base_url,
+				on_progress=lambda text: queue.put_nowait({"type": "progress", "text": text})
+			)
+		except Exception as e:
+			_terminal_log("Streaming /gemini_chat error", {"error": str(e)})
+			payload = {"reply": f"Error: {e}", "session_incomplete": True}
+		queue.put_nowait({"type": "final", **payload})
+
+	async def _events():
+		task = asyncio.create_task(_produce())
+		try:
+			while True:
+				event = await queue.get()
+				yield json.dumps(event, default=str) + "\n"
+				if event["type"] == "final":
+					break
+		finally:
+			if not task.done():
+				task.cancel()
+
+	return StreamingResponse(_events(), media_type="application/x-ndjson")
+
+
+async def _run_chat_session(data: dict, base_url: str, on_progress: Optional[Callable[[str], None]] = None) -> dict:
+	"""Run one orchestrated chat session and return the final payload.
+
+	Args:
+		data: Request body with ``prompt`` and optional ``system_prompt``
+		base_url: Server base URL used to call the mounted tools
+		on_progress: Called with each visible message as it is produced
+	"""
 	user_prompt = (data.get("prompt") or "").strip()
 	user_system_prompt = data.get("system_prompt")
 	_terminal_log("Incoming /gemini_chat request", {"prompt": user_prompt, "has_system_prompt": bool(user_system_prompt)})
@@ -575,9 +632,14 @@ async def gemini_chat(request: Request):
 	combined_system_prompt = f"{user_system_prompt}\n\n{tool_system_prompt}" if user_system_prompt else tool_system_prompt
 	gemini_ai = _create_llm_client(system_prompt=combined_system_prompt)
 
-	base_url = str(request.base_url).rstrip("/")
 	conversation_history: list[dict[str, Any]] = []
 	progress_messages: list[str] = []
+
+	def _add_progress(text: str) -> None:
+		progress_messages.append(text)
+		if on_progress is not None:
+			on_progress(text)
+
 	tool_trace: list[dict[str, Any]] = []
 	session_active = False
 	session_incomplete = False
@@ -602,7 +664,7 @@ async def gemini_chat(request: Request):
 				"content": "[SESSION_CONTINUE_PROMPT_SENT]"
 			})
 		_terminal_log("LLM request", {"turn": turn, "prompt": pending_prompt})
-		response = gemini_ai.get_response(pending_prompt)
+		response = await asyncio.to_thread(gemini_ai.get_response, pending_prompt)
 		_terminal_log("LLM raw response", {"turn": turn, "response": response})
 		visible_text, commands, parse_error = parse_llm_response(response)
 		_terminal_log("LLM parsed response", {"turn": turn, "visible_text": visible_text, "commands": commands, "parse_error": parse_error})
@@ -616,7 +678,7 @@ async def gemini_chat(request: Request):
 		})
 
 		if visible_text:
-			progress_messages.append(visible_text)
+			_add_progress(visible_text)
 			last_visible_text = visible_text
 
 		if parse_error and not commands:
@@ -676,12 +738,12 @@ async def gemini_chat(request: Request):
 				finalize_prompt = build_final_answer_prompt(user_prompt, conversation_history, tool_trace)
 				conversation_history.append({"type": "finalize_prompt", "turn": turn, "content": finalize_prompt})
 				_terminal_log("Finalize prompt", {"turn": turn, "prompt": finalize_prompt})
-				finalize_response = gemini_ai.get_response(finalize_prompt)
+				finalize_response = await asyncio.to_thread(gemini_ai.get_response, finalize_prompt)
 				_terminal_log("Finalize raw response", {"turn": turn, "response": finalize_response})
 				final_text, _, _ = parse_llm_response(finalize_response)
 				_terminal_log("Finalize parsed response", {"turn": turn, "final_text": final_text})
 				if final_text:
-					progress_messages.append(final_text)
+					_add_progress(final_text)
 					final_reply = final_text
 			elif not final_reply:
 				final_reply = "Session completed."
@@ -706,7 +768,7 @@ async def gemini_chat(request: Request):
 		force_prompt = build_session_follow_up_prompt(user_prompt, conversation_history, force_close=True)
 		conversation_history.append({"type": "forced_close_prompt", "content": force_prompt})
 		_terminal_log("Forced-close prompt", {"prompt": force_prompt})
-		force_response = gemini_ai.get_response(force_prompt)
+		force_response = await asyncio.to_thread(gemini_ai.get_response, force_prompt)
 		_terminal_log("Forced-close raw response", {"response": force_response})
 		visible_text, force_commands, _ = parse_llm_response(force_response)
 		_terminal_log("Forced-close parsed response", {"visible_text": visible_text, "commands": force_commands})
@@ -719,7 +781,7 @@ async def gemini_chat(request: Request):
 		})
 
 		if visible_text:
-			progress_messages.append(visible_text)
+			_add_progress(visible_text)
 			last_visible_text = visible_text
 
 		stop_called = any(cmd.get("tool") in CONTROL_STOP_TOOLS for cmd in force_commands)
@@ -729,12 +791,12 @@ async def gemini_chat(request: Request):
 		if not final_reply and tool_trace:
 			fallback_prompt = build_final_answer_prompt(user_prompt, conversation_history, tool_trace)
 			_terminal_log("Fallback final prompt", {"prompt": fallback_prompt})
-			fallback_response = gemini_ai.get_response(fallback_prompt)
+			fallback_response = await asyncio.to_thread(gemini_ai.get_response, fallback_prompt)
 			_terminal_log("Fallback final raw response", {"response": fallback_response})
 			fallback_text, _, _ = parse_llm_response(fallback_response)
 			_terminal_log("Fallback final parsed response", {"final_text": fallback_text})
 			if fallback_text:
-				progress_messages.append(fallback_text)
+				_add_progress(fallback_text)
 				final_reply = fallback_text
 
 		session_incomplete = not stop_called
@@ -751,12 +813,12 @@ async def gemini_chat(request: Request):
 	if not final_reply and tool_trace:
 		finalize_prompt = build_final_answer_prompt(user_prompt, conversation_history, tool_trace)
 		_terminal_log("Post-loop finalize prompt", {"prompt": finalize_prompt})
-		finalize_response = gemini_ai.get_response(finalize_prompt)
+		finalize_response = await asyncio.to_thread(gemini_ai.get_response, finalize_prompt)
 		_terminal_log("Post-loop finalize raw response", {"response": finalize_response})
 		final_text, _, _ = parse_llm_response(finalize_response)
 		_terminal_log("Post-loop finalize parsed response", {"final_text": final_text})
 		if final_text:
-			progress_messages.append(final_text)
+			_add_progress(final_text)
 			final_reply = final_text
 
 	conversation_history.clear()
@@ -781,5 +843,9 @@ def root():
 	return {"message": "Unified MCP API is running."}
 
 if __name__ == "__main__":
+	import importlib.util
 	import uvicorn
-	uvicorn.run(api, host="0.0.0.0", port=8000)
\ No newline at end of file
+	# uvloop only exists on Linux/macOS; Windows (and installs without it) use the stdlib loop
+	loop = "uvloop" if importlib.util.find_spec("uvloop") is not None else "asyncio"
+	_terminal_log("Event loop", loop)
+	uvicorn.run(api, host="0.0.0.0", port=8000, loop=loop)
\ No newline at end of file
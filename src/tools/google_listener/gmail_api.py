@@ -13,6 +13,9 @@ from googleapiclient.discovery import build
 # Gmail API scope
 SCOPES = ['https://www.googleapis.com/auth/gmail.modify']
 
+# Gmail accepts at most 100 sub-requests per batch HTTP call
+BATCH_SIZE = 100
+
 def authenticate_gmail(credentials_path, token_path):
     """
     Authenticate with Gmail API using user's credentials.json.
@@ -35,6 +38,29 @@ def authenticate_gmail(credentials_path, token_path):
     service = build('gmail', 'v1', credentials=creds)
     return service
 
+def _batch_get_messages(service, ids, **get_kwargs):
+    """
+    Fetch several messages with batched HTTP requests instead of one call per id.
+    Extra keyword arguments are passed to users().messages().get().
+    Returns message resources in the same order as ids; failed fetches are skipped.
+    """
+    responses = {}
+
+    def _collect(request_id, response, exception):
+        if exception is None:
+            responses[request_id] = response
+
+    for start in range(0, len(ids), BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_collect)
+        for offset, msg_id in enumerate(ids[start:start + BATCH_SIZE]):
+            batch.add(
+                service.users().messages().get(userId='me', id=msg_id, **get_kwargs),
+                request_id=str(start + offset)
+            )
+        batch.execute()
+
+    return [responses[str(i)] for i in range(len(ids)) if str(i) in responses]
+
 def list_unread_emails(service):
     """
     List all unread emails in the user's inbox.
@@ -46,8 +72,8 @@ def list_unread_emails(service):
     if not messages:
         print("No new messages.")
     else:
-        for msg in messages:
-            msg_data = service.users().messages().get(userId='me', id=msg['id']).execute()
+        ids = [msg['id'] for msg in messages]
+        for msg_data in _batch_get_messages(service, ids, format='metadata', metadataHeaders=['Subject', 'From']):
             headers = msg_data['payload']['headers']
             subject = next((h['value'] for h in headers if h['name'] == 'Subject'), "")
             sender = next((h['value'] for h in headers if h['name'] == 'From'), "")
@@ -55,45 +81,73 @@ def list_unread_emails(service):
             # Optionally mark as read
             service.users().messages().modify(
                 userId='me', 
-                id=msg['id'], 
+                id=msg_data['id'], 
                 body={'removeLabelIds': ['UNREAD']}
             ).execute()
 
-def get_new_email_subject_and_body(service):
+def list_unread_ids(service):
     """
-    Returns a list of dicts with subject and body for each new unread email.
-    Marks them as read after fetching.
+    Returns the ids of unread messages in the user's mailbox.
     """
     results = service.users().messages().list(userId='me', labelIds=['UNREAD']).execute()
-    messages = results.get('messages', [])
+    return [msg['id'] for msg in results.get('messages', [])]
+
+def _decode_body_data(data, max_chars=None):
+    """
+    Decode base64url body data. When max_chars is set, only the base64 prefix
+    needed for max_chars characters (at most 4 UTF-8 bytes each) is decoded.
+    """
+    if max_chars is not None:
+        needed = -(-max_chars * 4 // 3) * 4
+        data = data[:needed]
+        data += '=' * (-len(data) % 4)
+        return base64.urlsafe_b64decode(data.encode()).decode(errors='ignore')[:max_chars]
+    return base64.urlsafe_b64decode(data.encode()).decode(errors='ignore')
+
+def _extract_plain_body(payload, max_chars=None):
+    """
+    Decode the text/plain body of a message payload fetched with format='full'.
+    The result is truncated to max_chars characters when given.
+    """
+    if 'parts' in payload:
+        for part in payload['parts']:
+            if part['mimeType'] == 'text/plain':
+                return _decode_body_data(part['body'].get('data', ""), max_chars)
+        return ""
+    data = payload['body'].get('data', "")
+    if not data:
+        return ""
+    return _decode_body_data(data, max_chars)
+
+def get_email_body(service, msg_id):
+    """
+    Returns the plain-text body of a single message.
+    """
+    msg_data = service.users().messages().get(userId='me', id=msg_id, format='full').execute()
+    return _extract_plain_body(msg_data['payload'])
+
+def get_new_email_subject_and_body(service, ids=None, body_max_chars=None):
+    """
+    Returns a list of dicts with id, subject, sender and body for new unread emails.
+    ids limits the fetch to those messages (e.g. one page of list_unread_ids);
+    by default every unread message is fetched. Each message is downloaded once
+    with format='full', which carries both the headers and the body.
+    Bodies are truncated to body_max_chars while decoding when it is set.
+    Emails are left unread.
+    """
+    if ids is None:
+        ids = list_unread_ids(service)
+    if not ids:
+        return []
     emails = []
-    if not messages:
-        return emails
-    for msg in messages:
-        msg_data = service.users().messages().get(userId='me', id=msg['id'], format='full').execute()
-        headers = msg_data['payload']['headers']
-        subject = next((h['value'] for h in headers if h['name'] == 'Subject'), "")
-        sender = next((h['value'] for h in headers if h['name'] == 'From'), "")
-        # Get the body (text/plain)
-        body = ""
-        if 'parts' in msg_data['payload']:
-            for part in msg_data['payload']['parts']:
-                if part['mimeType'] == 'text/plain':
-                    body = part['body'].get('data', "")
-                    import base64
-                    body = base64.urlsafe_b64decode(body.encode()).decode(errors='ignore')
-                    break
-        else:
-            body = msg_data['payload']['body'].get('data', "")
-            if body:
-                import base64
-                body = base64.urlsafe_b64decode(body.encode()).decode(errors='ignore')
+    for msg_data in _batch_get_messages(service, ids, format='full'):
+        headers = msg_data['payload'].get('headers', [])
         emails.append({
-            'subject': subject,
-            'body': body,
-            'sender': sender
+            'id': msg_data['id'],
+            'subject': next((h['value'] for h in headers if h['name'] == 'Subject'), ""),
+            'sender': next((h['value'] for h in headers if h['name'] == 'From'), ""),
+            'body': _extract_plain_body(msg_data['payload'], body_max_chars)
         })
-        # Do NOT mark as read; keep email as unread
     return emails
 
 def reply_to_email(service, to_email, subject, body, thread_id=None):
@@ -2,6 +2,8 @@
 import json
 import requests
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 import sys
 import os
@@ -12,8 +14,15 @@ from login import login
 seen_events = set()
 seen_tasks = set()
 
+# Fetchers may run concurrently; only one may refresh tokens / run the device flow
+_login_lock = threading.Lock()
+
+# Upper bound on concurrent per-list task requests in get_pending_tasks
+TASK_LIST_WORKERS = 8
+
 def get_headers():
-    access_token = login()
+    with _login_lock:
+        access_token = login()
     return {"Authorization": f"Bearer {access_token}"}
 
 def get_new_emails():
@@ -74,13 +83,24 @@ def get_pending_tasks():
     global seen_tasks
     try:
         url = "https://graph.microsoft.com/v1.0/me/todo/lists"
-        lists = requests.get(url, headers=get_headers(), timeout=10).json().get("value", [])
-        all_tasks = []
-        new_tasks = []
-        for lst in lists:
+        headers = get_headers()
+        lists = requests.get(url, headers=headers, timeout=10).json().get("value", [])
+
+        def fetch_list_tasks(lst):
             # Filter to only get incomplete tasks
             t_url = f"https://graph.microsoft.com/v1.0/me/todo/lists/{lst['id']}/tasks?$filter=status ne 'completed'"
-            t_resp = requests.get(t_url, headers=get_headers(), timeout=10).json().get("value", [])
+            return requests.get(t_url, headers=headers, timeout=10).json().get("value", [])
+
+        # Lists are independent, so fetch them concurrently (results keep list order)
+        if lists:
+            with ThreadPoolExecutor(max_workers=min(TASK_LIST_WORKERS, len(lists))) as pool:
+                per_list = list(pool.map(fetch_list_tasks, lists))
+        else:
+            per_list = []
+
+        all_tasks = []
+        new_tasks = []
+        for t_resp in per_list:
             for task in t_resp:
                 all_tasks.append(task)
                 if task["id"] not in seen_tasks:
@@ -13,12 +13,71 @@ Requirements:
 """
 
 import sys
+import time
+import threading
+from functools import lru_cache
+from itertools import islice, zip_longest
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 
 
+# One connection pool for every WeatherFetcher, so keep-alive connections to
+# open-meteo.com survive across fetcher instances
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _shared_session() -> requests.Session:
+    """Return the module-wide requests session, creating it on first use."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+            _SESSION = session
+        return _SESSION
+
+
+# WMO weather interpretation codes used by Open-Meteo
+_WMO_CODES = {
+    0: "Clear sky",
+    1: "Mainly clear",
+    2: "Partly cloudy",
+    3: "Overcast",
+    45: "Foggy",
+    48: "Depositing rime fog",
+    51: "Light drizzle",
+    53: "Moderate drizzle",
+    55: "Dense drizzle",
+    61: "Slight rain",
+    63: "Moderate rain",
+    65: "Heavy rain",
+    71: "Slight snow",
+    73: "Moderate snow",
+    75: "Heavy snow",
+    77: "Snow grains",
+    80: "Slight rain showers",
+    81: "Moderate rain showers",
+    82: "Violent rain showers",
+    85: "Slight snow showers",
+    86: "Heavy snow showers",
+    95: "Thunderstorm",
+    96: "Thunderstorm with slight hail",
+    99: "Thunderstorm with heavy hail"
+}
+# Same table as a tuple indexed by code (None for unassigned codes) for hash-free lookups
+_WMO_ARR = tuple(_WMO_CODES.get(i) for i in range(100))
+
+
+@lru_cache(maxsize=64)
+def _day_label(date_str: str) -> str:
+    """Render an ISO date as e.g. 'Monday, January 05'."""
+    return datetime.fromisoformat(date_str).strftime('%A, %B %d')
+
+
 class WeatherFetcher:
     """
     Fetches weather information using Open-Meteo API.
@@ -28,13 +87,25 @@ class WeatherFetcher:
     GEOCODING_URL = "https://geocoding-api.open-meteo.com/v1/search"
     WEATHER_URL = "https://api.open-meteo.com/v1/forecast"
     
-    def __init__(self):
-        """Initialize weather fetcher."""
-        self.session = requests.Session()
+    # Place coordinates practically never change, so resolved locations are kept for a day
+    GEOCODE_TTL_SECONDS = 24 * 60 * 60
+    GEOCODE_CACHE_MAX = 1024
+    
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize weather fetcher.
+        
+        Args:
+            session: HTTP session to use (defaults to the shared module session)
+        """
+        self.session = session or _shared_session()
+        # normalized location -> (expires_at, (lat, lon, full_name))
+        self._geocode_cache: Dict[str, Tuple[float, Tuple[float, float, str]]] = {}
+        self._geocode_lock = threading.Lock()
     
     def geocode_location(self, location: str) -> Optional[Tuple[float, float, str]]:
         """
-        Convert location name to coordinates.
+        Convert location name to coordinates, reusing recent lookups.
         
         Args:
             location: City name or location string
@@ -42,6 +113,24 @@ class WeatherFetcher:
         Returns:
             Tuple of (latitude, longitude, full_name) or None if not found
         """
+        key = location.strip().lower()
+        now = time.monotonic()
+        with self._geocode_lock:
+            entry = self._geocode_cache.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+        
+        result = self._fetch_geocode(location)
+        if result:
+            with self._geocode_lock:
+                if key not in self._geocode_cache and len(self._geocode_cache) >= self.GEOCODE_CACHE_MAX:
+                    # Drop the oldest insertion to stay bounded
+                    self._geocode_cache.pop(next(iter(self._geocode_cache)))
+                self._geocode_cache[key] = (now + self.GEOCODE_TTL_SECONDS, result)
+        return result
+    
+    def _fetch_geocode(self, location: str) -> Optional[Tuple[float, float, str]]:
+        """Query the geocoding API for a location (uncached)."""
         try:
             params = {
                 'name': location,
@@ -162,34 +251,12 @@ class WeatherFetcher:
         Returns:
             Human-readable weather description
         """
-        weather_codes = {
-            0: "Clear sky",
-            1: "Mainly clear",
-            2: "Partly cloudy",
-            3: "Overcast",
-            45: "Foggy",
-            48: "Depositing rime fog",
-            51: "Light drizzle",
-            53: "Moderate drizzle",
-            55: "Dense drizzle",
-            61: "Slight rain",
-            63: "Moderate rain",
-            65: "Heavy rain",
-            71: "Slight snow",
-            73: "Moderate snow",
-            75: "Heavy snow",
-            77: "Snow grains",
-            80: "Slight rain showers",
-            81: "Moderate rain showers",
-            82: "Violent rain showers",
-            85: "Slight snow showers",
-            86: "Heavy snow showers",
-            95: "Thunderstorm",
-            96: "Thunderstorm with slight hail",
-            99: "Thunderstorm with heavy hail"
-        }
-        
-        return weather_codes.get(code, f"Unknown ({code})")
+        if type(code) is int and 0 <= code < 100:
+            description = _WMO_ARR[code]
+        else:
+            # Non-int or out-of-range codes (e.g. 3.0) take the slower mapping path
+            description = _WMO_CODES.get(code)
+        return description if description is not None else f"Unknown ({code})"
     
     def format_current_weather(self, weather_data: Dict) -> str:
         """
@@ -216,16 +283,18 @@ class WeatherFetcher:
         
         condition = self.interpret_weather_code(weather_code)
         
-        output = f"Weather in {location}:\n"
-        output += f"  Condition: {condition}\n"
-        output += f"  Temperature: {temp}°C (feels like {feels_like}°C)\n"
-        output += f"  Humidity: {humidity}%\n"
-        output += f"  Wind Speed: {wind_speed} km/h\n"
+        parts = [
+            f"Weather in {location}:\n"
+            f"  Condition: {condition}\n"
+            f"  Temperature: {temp}°C (feels like {feels_like}°C)\n"
+            f"  Humidity: {humidity}%\n"
+            f"  Wind Speed: {wind_speed} km/h\n"
+        ]
         
         if precipitation > 0:
-            output += f"  Precipitation: {precipitation} mm\n"
+            parts.append(f"  Precipitation: {precipitation} mm\n")
         
-        return output
+        return "".join(parts)
     
     def format_forecast(self, weather_data: Dict, days: int = 3) -> str:
         """
@@ -244,7 +313,7 @@ class WeatherFetcher:
         location = weather_data.get('location', 'Unknown location')
         daily = weather_data.get('daily', {})
         
-        output = f"Weather forecast for {location}:\n\n"
+        parts = [f"Weather forecast for {location}:\n\n"]
         
         dates = daily.get('time', [])
         max_temps = daily.get('temperature_2m_max', [])
@@ -252,26 +321,28 @@ class WeatherFetcher:
         precip = daily.get('precipitation_sum', [])
         weather_codes = daily.get('weather_code', [])
         
-        for i in range(min(days, len(dates))):
-            date_str = dates[i]
-            date_obj = datetime.fromisoformat(date_str)
-            day_name = date_obj.strftime('%A, %B %d')
+        # zip_longest pads shorter series with None; the date list bounds the loop
+        days_iter = islice(zip_longest(dates, weather_codes, max_temps, min_temps, precip), min(days, len(dates)))
+        for date_str, code, max_temp, min_temp, precipitation in days_iter:
+            day_name = _day_label(date_str)
+            condition = self.interpret_weather_code(code) if code is not None else 'N/A'
+            if max_temp is None:
+                max_temp = 'N/A'
+            if min_temp is None:
+                min_temp = 'N/A'
             
-            condition = self.interpret_weather_code(weather_codes[i]) if i < len(weather_codes) else 'N/A'
-            max_temp = max_temps[i] if i < len(max_temps) else 'N/A'
-            min_temp = min_temps[i] if i < len(min_temps) else 'N/A'
-            precipitation = precip[i] if i < len(precip) else 0
+            parts.append(
+                f"{day_name}:\n"
+                f"  {condition}\n"
+                f"  High: {max_temp}°C, Low: {min_temp}°C\n"
+            )
             
-            output += f"{day_name}:\n"
-            output += f"  {condition}\n"
-            output += f"  High: {max_temp}°C, Low: {min_temp}°C\n"
+            if precipitation:
+                parts.append(f"  Precipitation: {precipitation} mm\n")
             
-            if precipitation > 0:
-                output += f"  Precipitation: {precipitation} mm\n"
-            
-            output += "\n"
+            parts.append("\n")
         
-        return output
+        return "".join(parts)
 
 
 def get_current_weather(location: str) -> str:
@@ -291,18 +362,19 @@ def get_current_weather(location: str) -> str:
     return fetcher.format_current_weather(weather_data)
 
 
-def get_weather_forecast(location: str, days: int = 3) -> str:
+def get_weather_forecast(location: str, days: int = 3, fetcher: Optional[WeatherFetcher] = None) -> str:
     """
     Simple function to get weather forecast for a location.
     
     Args:
         location: City name or location string
         days: Number of forecast days (1-7)
+        fetcher: Existing WeatherFetcher to reuse (a new one is created if omitted)
     
     Returns:
         Formatted weather forecast string
     """
-    fetcher = WeatherFetcher()
+    fetcher = fetcher or WeatherFetcher()
     weather_data = fetcher.get_weather_by_location(location, forecast_days=max(1, min(days, 7)))
     
     if weather_data is None:
@@ -9,8 +9,28 @@ Requirements:
 """
 
 import sys
+import re
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Snippet sanitization: drop control characters, then collapse whitespace runs
+_WS_RE = re.compile(r'\s+')
+_CTRL_TBL = {c: None for c in (*range(32), 127) if chr(c) not in '\t\n\r'}
+
+
+def _clean(text: str) -> str:
+    """Strip control characters and collapse whitespace in result text."""
+    if not text:
+        return ''
+    return _WS_RE.sub(' ', text.translate(_CTRL_TBL)).strip()
+
 
 # Try to import duckduckgo_search
 try:
@@ -18,7 +38,7 @@ try:
     DDGS_AVAILABLE = True
 except ImportError:
     DDGS_AVAILABLE = False
-    print("Warning: ddgs not installed. Install with: pip install ddgs")
+    logger.warning("ddgs not installed. Install with: pip install ddgs")
 
 
 class WebSearcher:
@@ -26,9 +46,51 @@ class WebSearcher:
     Performs web searches using DuckDuckGo.
     """
     
+    __slots__ = ('ddgs', '_seen_links', '_seen_set', '_inflight', '_results', '_results_lock')
+    
+    # Number of recently shown links remembered for de-duplication
+    SEEN_LINKS_MAX = 512
+    
+    # Successful result lists are reused for identical searches within this window
+    RESULT_CACHE_TTL = 300
+    RESULT_CACHE_MAX = 1024
+    
     def __init__(self):
         """Initialize web searcher."""
         self.ddgs = DDGS() if DDGS_AVAILABLE else None
+        # deque keeps insertion order for eviction, set gives O(1) membership
+        self._seen_links: deque = deque()
+        self._seen_set: set = set()
+        # In-flight async searches keyed by (query, max_results, region)
+        self._inflight: Dict[Tuple[str, int, str], asyncio.Task] = {}
+        # (normalized query, max_results, region) -> (expires_at, results)
+        self._results: Dict[Tuple[str, int, str], Tuple[float, List[Dict[str, str]]]] = {}
+        self._results_lock = threading.Lock()
+    
+    def _mark_seen(self, link: str) -> bool:
+        """
+        Record a result link as shown.
+        
+        Args:
+            link: Result URL
+        
+        Returns:
+            True if the link was new, False if it was already shown
+        """
+        if not link:
+            return True
+        if link in self._seen_set:
+            return False
+        if len(self._seen_links) >= self.SEEN_LINKS_MAX:
+            self._seen_set.discard(self._seen_links.popleft())
+        self._seen_links.append(link)
+        self._seen_set.add(link)
+        return True
+    
+    def reset_seen(self) -> None:
+        """Forget all links shown by previous quick searches."""
+        self._seen_links.clear()
+        self._seen_set.clear()
     
     def search(
         self,
@@ -39,20 +101,48 @@ class WebSearcher:
         """
         Search the web for a query.
         
+        Successful results are reused for identical searches (case- and
+        whitespace-insensitive) for RESULT_CACHE_TTL seconds.
+        
         Args:
             query: Search query string
             max_results: Maximum number of results to return
             region: Search region (default: worldwide)
         
         Returns:
-            List of dicts with keys: 'title', 'link', 'snippet'
+            List of dicts with keys: 'title', 'link', 'snippet' (title and
+            snippet have whitespace normalized)
         """
+        key = (_WS_RE.sub(' ', query).strip().lower(), max_results, region)
+        now = time.monotonic()
+        with self._results_lock:
+            entry = self._results.get(key)
+        if entry and entry[0] > now:
+            return list(entry[1])
+        
+        results, ok = self._fetch(query, max_results, region)
+        if ok:
+            with self._results_lock:
+                if key not in self._results and len(self._results) >= self.RESULT_CACHE_MAX:
+                    # Drop the oldest insertion to stay bounded
+                    self._results.pop(next(iter(self._results)))
+                self._results[key] = (now + self.RESULT_CACHE_TTL, results)
+            return list(results)
+        return results
+    
+    def _fetch(
+        self,
+        query: str,
+        max_results: int,
+        region: str
+    ) -> Tuple[List[Dict[str, str]], bool]:
+        """Run the DDGS query (uncached); the flag is False for unavailable/error placeholders."""
         if not DDGS_AVAILABLE or not self.ddgs:
             return [{
                 'title': 'Search Unavailable',
                 'link': '',
                 'snippet': 'Web search requires duckduckgo-search package. Install with: pip install duckduckgo-search'
-            }]
+            }], False
         
         try:
             results = []
@@ -60,20 +150,101 @@ class WebSearcher:
             
             for result in search_results:
                 results.append({
-                    'title': result.get('title', ''),
+                    'title': _clean(result.get('title', '')),
                     'link': result.get('href', result.get('link', '')),
-                    'snippet': result.get('body', result.get('snippet', ''))
+                    'snippet': _clean(result.get('body', result.get('snippet', '')))
                 })
             
-            return results
+            return results, True
         
         except Exception as e:
-            print(f"Search error: {e}")
+            logger.warning("Search error: %s", e)
             return [{
                 'title': 'Search Error',
                 'link': '',
                 'snippet': f'An error occurred during search: {str(e)}'
-            }]
+            }], False
+    
+    async def search_async(
+        self,
+        query: str,
+        max_results: int = 5,
+        region: str = "us-en"
+    ) -> List[Dict[str, str]]:
+        """
+        Search the web without blocking the event loop.
+        
+        Concurrent calls with the same arguments share a single DDGS request
+        instead of each hitting the network.
+        
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to return
+            region: Search region
+        
+        Returns:
+            List of dicts with keys: 'title', 'link', 'snippet'
+        """
+        key = (query, max_results, region)
+        task = self._inflight.get(key)
+        if task is None:
+            # DDGS is synchronous, so the search runs in a worker thread
+            task = asyncio.ensure_future(
+                asyncio.to_thread(self.search, query, max_results=max_results, region=region)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield so one cancelled caller does not cancel the search for the others
+        return await asyncio.shield(task)
+    
+    async def search_multi(
+        self,
+        queries: List[Tuple[str, str]],
+        max_results: int = 5
+    ) -> List[List[Dict[str, str]]]:
+        """
+        Run several searches concurrently.
+        
+        A search that raises does not discard the others; it yields an empty list.
+        
+        Args:
+            queries: List of (query, region) pairs
+            max_results: Maximum number of results per search
+        
+        Returns:
+            One result list per (query, region) pair, in the same order
+        """
+        tasks = [
+            self.search_async(query, max_results=max_results, region=region)
+            for query, region in queries
+        ]
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        results = []
+        for (query, region), outcome in zip(queries, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning("Search for %r (%s) failed: %s", query, region, outcome)
+                outcome = []
+            results.append(outcome)
+        return results
+    
+    def search_multi_sync(
+        self,
+        queries: List[Tuple[str, str]],
+        max_results: int = 5
+    ) -> List[List[Dict[str, str]]]:
+        """
+        Blocking wrapper around search_multi() for callers without an event loop.
+        
+        Failed searches yield an empty list, as in search_multi().
+        
+        Args:
+            queries: List of (query, region) pairs
+            max_results: Maximum number of results per search
+        
+        Returns:
+            One result list per (query, region) pair, in the same order
+        """
+        return asyncio.run(self.search_multi(queries, max_results=max_results))
     
     def search_formatted(
         self,
@@ -115,6 +286,9 @@ class WebSearcher:
         """
         Perform a quick search and return a concise summary.
         
+        Results already shown by an earlier quick search on this instance
+        are skipped (see reset_seen()).
+        
         Args:
             query: Search query
         
@@ -127,15 +301,20 @@ class WebSearcher:
             return f"No information found for: {query}"
         
         summaries = []
+        skipped = 0
         for result in results:
+            if not self._mark_seen(result.get('link', '')):
+                skipped += 1
+                continue
             snippet = result.get('snippet', '')[:150]
             if snippet:
                 summaries.append(snippet)
         
         if summaries:
             return " ".join(summaries)
-        else:
-            return f"Found results for '{query}' but couldn't extract summaries."
+        if skipped == len(results):
+            return f"Nothing new found for '{query}'; all results were already shown."
+        return f"Found results for '{query}' but couldn't extract summaries."
 
 
 def web_search(query: str, max_results: int = 5, region: str = "wt-wt") -> str:
@@ -157,6 +336,10 @@ def quick_search(query: str) -> str:
     """
     Quick search function for brief information.
     
+    Each call uses a fresh WebSearcher, so results are never de-duplicated
+    against earlier calls; use WebSearcher.quick_search on a kept instance
+    for that.
+    
     Args:
         query: Search query
     
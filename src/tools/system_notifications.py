@@ -24,8 +24,14 @@ Requirements:
 
 import sys
 import platform
+import sqlite3
+import functools
+import threading
+import atexit
+import itertools
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
 
@@ -33,11 +39,242 @@ from datetime import datetime
 CURRENT_OS = platform.system()  # 'Windows', 'Darwin' (macOS), 'Linux'
 
 
+# Upper bound for SQLite memory-mapped reads; notification DBs are well below this
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+
+
+def _open_ro(db_file: Path) -> sqlite3.Connection:
+    """
+    Open a SQLite database read-only with settings tuned for small reads.
+    
+    Args:
+        db_file: Path to the database file
+    
+    Returns:
+        sqlite3 connection that refuses writes
+    """
+    # Connections may be shared across threads; callers serialize access
+    conn = sqlite3.connect(f"file:{db_file}?mode=ro&cache=private", uri=True, check_same_thread=False)
+    conn.execute("PRAGMA query_only=ON")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-4000")
+    # Serve page reads from the OS page cache instead of copying them into SQLite buffers
+    conn.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    return conn
+
+
+# macOS Notification Center storage (table and column names vary by macOS version)
+MACOS_DB_DIR = Path.home() / "Library" / "Application Support" / "NotificationCenter"
+_MACOS_TABLES = ('record', 'notifications', 'notification')
+_MACOS_TITLE_COLS = ('title', 'Title')
+_MACOS_BODY_COLS = ('body', 'Body')
+_MACOS_APP_COLS = ('app', 'bundleid')
+_MACOS_DATE_COLS = ('delivered_date', 'date')
+
+
+def _first_present(columns: List[str], candidates: Tuple[str, ...]) -> Optional[str]:
+    """Return the first candidate column name that exists in columns."""
+    return next((c for c in candidates if c in columns), None)
+
+
+def _build_macos_query(table: str, columns: List[str]) -> str:
+    """
+    Build the projected notification query for a discovered table.
+    
+    Args:
+        table: Notification table name
+        columns: Column names of that table
+    
+    Returns:
+        SQL selecting (title, body, app, timestamp) with a LIMIT placeholder
+    """
+    title_col = _first_present(columns, _MACOS_TITLE_COLS)
+    body_col = _first_present(columns, _MACOS_BODY_COLS)
+    app_col = _first_present(columns, _MACOS_APP_COLS)
+    date_col = _first_present(columns, _MACOS_DATE_COLS)
+    
+    title = f"COALESCE({title_col}, 'No Title')" if title_col else "'No Title'"
+    body = f"COALESCE({body_col}, '')" if body_col else "''"
+    app = f"COALESCE({app_col}, 'Unknown')" if app_col else "'Unknown'"
+    date = date_col or "NULL"
+    order = date_col or "rowid"
+    return f"SELECT {title}, {body}, {app}, {date} FROM {table} ORDER BY {order} DESC LIMIT ?"
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_macos_schema() -> Optional[Tuple[str, str]]:
+    """
+    Locate the macOS notification table once and cache the result.
+    
+    Returns:
+        Tuple of (db_path, query) where query selects only the needed columns,
+        or None if no usable table was found
+    """
+    for db_file in sorted(MACOS_DB_DIR.glob("*.db")):
+        try:
+            conn = _open_ro(db_file)
+        except sqlite3.Error as e:
+            print(f"Error reading database {db_file}: {e}")
+            continue
+        try:
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+            for table in _MACOS_TABLES:
+                if table not in tables:
+                    continue
+                columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+                return str(db_file), _build_macos_query(table, columns)
+        except sqlite3.Error as e:
+            print(f"Error reading database {db_file}: {e}")
+        finally:
+            conn.close()
+    return None
+
+
+# Long-lived read-only connection to the macOS notification DB, so the page
+# cache and parsed schema stay warm across requests
+_MACOS_CONN: Optional[sqlite3.Connection] = None
+_MACOS_CONN_PATH: Optional[str] = None
+_MACOS_CONN_LOCK = threading.Lock()
+
+
+def _get_macos_conn(db_path: str) -> sqlite3.Connection:
+    """
+    Return the shared connection for db_path, opening it on first use.
+    Callers must hold _MACOS_CONN_LOCK.
+    """
+    global _MACOS_CONN, _MACOS_CONN_PATH
+    if _MACOS_CONN is None or _MACOS_CONN_PATH != db_path:
+        _close_macos_conn()
+        _MACOS_CONN = _open_ro(db_path)
+        _MACOS_CONN_PATH = db_path
+    return _MACOS_CONN
+
+
+def _close_macos_conn() -> None:
+    """Close the shared macOS notification DB connection if open."""
+    global _MACOS_CONN, _MACOS_CONN_PATH
+    if _MACOS_CONN is not None:
+        _MACOS_CONN.close()
+    _MACOS_CONN = None
+    _MACOS_CONN_PATH = None
+
+
+atexit.register(_close_macos_conn)
+
+
+# Windows: notifications pushed by the notification_changed event, newest last.
+# None until the subscription succeeds; readers then fall back to a full scan.
+WINDOWS_RING_SIZE = 256
+_WINDOWS_RING: Optional[deque] = None
+_WINDOWS_RING_LOCK = threading.Lock()
+_WINDOWS_SUBSCRIBE_ATTEMPTED = False
+
+
+def _parse_windows_notification(notif, fallback_id: str) -> Dict[str, str]:
+    """
+    Convert a winsdk UserNotification into a notification dict.
+    
+    Args:
+        notif: UserNotification from UserNotificationListener
+        fallback_id: Id to use when the notification has none
+    
+    Returns:
+        Notification dict with keys: title, body, app, timestamp, id
+    """
+    app_info = notif.app_info
+    notification = notif.notification
+    
+    app_name = app_info.display_info.display_name if app_info and app_info.display_info else "Unknown"
+    
+    # Get notification content
+    visual = notification.visual if notification else None
+    
+    title = ""
+    body = ""
+    
+    if visual and visual.bindings:
+        binding = visual.bindings[0]
+        if binding.get_text_elements():
+            text_elements = list(binding.get_text_elements())
+            if len(text_elements) > 0:
+                title = text_elements[0].text
+            if len(text_elements) > 1:
+                body = text_elements[1].text
+    
+    return {
+        'title': title or 'No Title',
+        'body': body,
+        'app': app_name,
+        'timestamp': datetime.now().isoformat(),
+        'id': notif.id if hasattr(notif, 'id') else fallback_id
+    }
+
+
+def _ensure_windows_subscription(manager, management) -> None:
+    """
+    Seed the Windows notification ring once and keep it updated via events.
+    
+    Unpackaged desktop apps may not be allowed to subscribe to
+    notification_changed; in that case the ring stays None.
+    
+    Args:
+        manager: UserNotificationListener with access already granted
+        management: winsdk.windows.ui.notifications.management module
+    """
+    global _WINDOWS_RING, _WINDOWS_SUBSCRIBE_ATTEMPTED
+    with _WINDOWS_RING_LOCK:
+        if _WINDOWS_SUBSCRIBE_ATTEMPTED:
+            return
+        _WINDOWS_SUBSCRIBE_ATTEMPTED = True
+    
+    def _on_changed(sender, args):
+        try:
+            if args.change_kind == management.UserNotificationChangedKind.ADDED:
+                notif = manager.get_notification(args.user_notification_id)
+                if notif is not None:
+                    parsed = _parse_windows_notification(notif, str(args.user_notification_id))
+                    with _WINDOWS_RING_LOCK:
+                        _WINDOWS_RING.append(parsed)
+            else:
+                with _WINDOWS_RING_LOCK:
+                    for item in list(_WINDOWS_RING):
+                        if item['id'] == args.user_notification_id:
+                            _WINDOWS_RING.remove(item)
+                            break
+        except Exception as e:
+            print(f"Error handling notification change: {e}")
+    
+    try:
+        ring = deque(maxlen=WINDOWS_RING_SIZE)
+        for i, notif in enumerate(manager.get_notifications_async(management.NotificationKinds.TOAST).get()):
+            try:
+                ring.append(_parse_windows_notification(notif, str(i)))
+            except Exception as e:
+                print(f"Error parsing notification: {e}")
+        with _WINDOWS_RING_LOCK:
+            _WINDOWS_RING = ring
+        manager.add_notification_changed(_on_changed)
+    except Exception as e:
+        print(f"Windows notification events unavailable, falling back to polling: {e}")
+        with _WINDOWS_RING_LOCK:
+            _WINDOWS_RING = None
+
+
 class SystemNotificationReader:
     """
     Cross-platform system notification reader.
+    
+    Instantiating this class returns the subclass for the current OS, so
+    per-call methods do not branch on the platform.
     """
     
+    __slots__ = ('os_type', '_available')
+    
+    def __new__(cls):
+        if cls is SystemNotificationReader:
+            cls = _READER_CLASSES.get(CURRENT_OS, SystemNotificationReader)
+        return super().__new__(cls)
+    
     def __init__(self):
         """Initialize system notification reader."""
         self.os_type = CURRENT_OS
@@ -45,27 +282,12 @@ class SystemNotificationReader:
     
     def _check_availability(self) -> bool:
         """Check if system notification reading is available."""
-        if self.os_type == "Windows":
-            try:
-                # Check if winsdk is available
-                import winsdk.windows.ui.notifications as notifications
-                return True
-            except ImportError:
-                print("Windows notification reading requires: pip install winsdk")
-                return False
-        
-        elif self.os_type == "Darwin":  # macOS
-            # Check if notification database exists
-            home = Path.home()
-            db_path = home / "Library" / "Application Support" / "NotificationCenter"
-            return db_path.exists()
-        
-        elif self.os_type == "Linux":
-            # Linux notification reading is complex and varies by desktop environment
-            return False
-        
         return False
     
+    def _read_notifications(self, limit: int) -> List[Dict[str, str]]:
+        """Read notifications from the platform source; overridden per OS."""
+        return []
+    
     def is_available(self) -> bool:
         """Check if notification reading is available on this system."""
         return self._available
@@ -100,45 +322,21 @@ class SystemNotificationReader:
                     'timestamp': datetime.now().isoformat()
                 }]
             
+            _ensure_windows_subscription(manager, management)
+            with _WINDOWS_RING_LOCK:
+                if _WINDOWS_RING is not None:
+                    # Newest first, without enumerating the Action Center
+                    return list(itertools.islice(reversed(_WINDOWS_RING), limit))
+            
             # Get notifications
             notifications_list = manager.get_notifications_async(
                 management.NotificationKinds.TOAST
             ).get()
             
             results = []
-            for i, notif in enumerate(notifications_list):
-                if i >= limit:
-                    break
-                
+            for i, notif in enumerate(itertools.islice(notifications_list, limit)):
                 try:
-                    # Parse notification
-                    app_info = notif.app_info
-                    notification = notif.notification
-                    
-                    app_name = app_info.display_info.display_name if app_info and app_info.display_info else "Unknown"
-                    
-                    # Get notification content
-                    visual = notification.visual if notification else None
-                    
-                    title = ""
-                    body = ""
-                    
-                    if visual and visual.bindings:
-                        binding = visual.bindings[0]
-                        if binding.get_text_elements():
-                            text_elements = list(binding.get_text_elements())
-                            if len(text_elements) > 0:
-                                title = text_elements[0].text
-                            if len(text_elements) > 1:
-                                body = text_elements[1].text
-                    
-                    results.append({
-                        'title': title or 'No Title',
-                        'body': body,
-                        'app': app_name,
-                        'timestamp': datetime.now().isoformat(),
-                        'id': notif.id if hasattr(notif, 'id') else str(i)
-                    })
+                    results.append(_parse_windows_notification(notif, str(i)))
                 
                 except Exception as e:
                     print(f"Error parsing notification: {e}")
@@ -169,78 +367,43 @@ class SystemNotificationReader:
             return []
         
         try:
-            import sqlite3
-            
-            # Find notification database
-            home = Path.home()
-            db_dir = home / "Library" / "Application Support" / "NotificationCenter"
+            schema = _resolve_macos_schema()
             
-            # The database file may have different names across macOS versions
-            db_files = list(db_dir.glob("*.db"))
-            
-            if not db_files:
+            if schema is None:
+                if not any(MACOS_DB_DIR.glob("*.db")):
+                    return [{
+                        'title': 'Database Not Found',
+                        'body': 'Could not locate macOS Notification Center database',
+                        'app': 'System',
+                        'timestamp': datetime.now().isoformat()
+                    }]
                 return [{
-                    'title': 'Database Not Found',
-                    'body': 'Could not locate macOS Notification Center database',
+                    'title': 'Unable to Parse',
+                    'body': 'macOS Notification Center database found but could not parse notifications',
                     'app': 'System',
                     'timestamp': datetime.now().isoformat()
                 }]
             
-            # Try each database file
-            for db_file in db_files:
+            db_path, query = schema
+            
+            with _MACOS_CONN_LOCK:
                 try:
-                    conn = sqlite3.connect(f"file:{db_file}?mode=ro", uri=True)
-                    cursor = conn.cursor()
-                    
-                    # Query notifications (table structure varies by macOS version)
-                    # Try common table names
-                    tables = ['record', 'notifications', 'notification']
-                    
-                    for table in tables:
-                        try:
-                            query = f"""
-                                SELECT * FROM {table}
-                                ORDER BY rowid DESC
-                                LIMIT ?
-                            """
-                            cursor.execute(query, (limit,))
-                            rows = cursor.fetchall()
-                            
-                            if rows:
-                                # Get column names
-                                columns = [description[0] for description in cursor.description]
-                                
-                                results = []
-                                for row in rows:
-                                    row_dict = dict(zip(columns, row))
-                                    
-                                    # Extract relevant fields (structure varies)
-                                    results.append({
-                                        'title': str(row_dict.get('title', row_dict.get('Title', 'No Title'))),
-                                        'body': str(row_dict.get('body', row_dict.get('Body', ''))),
-                                        'app': str(row_dict.get('app', row_dict.get('bundleid', 'Unknown'))),
-                                        'timestamp': str(row_dict.get('delivered_date', row_dict.get('date', datetime.now().isoformat()))),
-                                        'raw': str(row_dict)[:200]  # Include some raw data for debugging
-                                    })
-                                
-                                conn.close()
-                                return results
-                        
-                        except sqlite3.OperationalError:
-                            continue
-                    
-                    conn.close()
-                
-                except Exception as e:
-                    print(f"Error reading database {db_file}: {e}")
-                    continue
+                    rows = _get_macos_conn(db_path).execute(query, (limit,)).fetchall()
+                except sqlite3.OperationalError:
+                    # Schema changed (e.g. after an OS update); reopen and probe again next call
+                    _close_macos_conn()
+                    _resolve_macos_schema.cache_clear()
+                    raise
             
-            return [{
-                'title': 'Unable to Parse',
-                'body': 'macOS Notification Center database found but could not parse notifications',
-                'app': 'System',
-                'timestamp': datetime.now().isoformat()
-            }]
+            return [
+                {
+                    'title': str(title),
+                    'body': str(body),
+                    'app': str(app),
+                    'timestamp': str(timestamp) if timestamp is not None else datetime.now().isoformat()
+                }
+                for title, body, app, timestamp in rows
+            ]
         
         except Exception as e:
             print(f"Error reading macOS notifications: {e}")
@@ -269,21 +432,7 @@ class SystemNotificationReader:
                 'timestamp': datetime.now().isoformat()
             }]
         
-        if self.os_type == "Windows":
-            return self.get_notifications_windows(limit)
-        
-        elif self.os_type == "Darwin":
-            return self.get_notifications_macos(limit)
-        
-        elif self.os_type == "Linux":
-            return [{
-                'title': 'Not Implemented',
-                'body': 'Linux notification reading not yet implemented',
-                'app': 'System',
-                'timestamp': datetime.now().isoformat()
-            }]
-        
-        return []
+        return self._read_notifications(limit)
     
     def format_notifications(self, notifications: List[Dict[str, str]]) -> str:
         """
@@ -298,25 +447,73 @@ class SystemNotificationReader:
         if not notifications:
             return "No system notifications found."
         
-        output_parts = [f"System Notifications ({len(notifications)}):\n"]
-        
-        for i, notif in enumerate(notifications, 1):
-            title = notif.get('title', 'No Title')
-            body = notif.get('body', '')
-            app = notif.get('app', 'Unknown')
-            
-            output_parts.append(
-                f"\n{i}. [{app}] {title}"
-            )
-            
-            if body:
-                # Truncate long bodies
-                body_preview = body[:150]
-                if len(body) > 150:
-                    body_preview += "..."
-                output_parts.append(f"   {body_preview}")
+        def _iter_lines():
+            yield f"System Notifications ({len(notifications)}):\n"
+            for i, notif in enumerate(notifications, 1):
+                get = notif.get
+                yield f"\n{i}. [{get('app', 'Unknown')}] {get('title', 'No Title')}"
+                body = get('body', '')
+                if body:
+                    # Truncate long bodies
+                    yield f"   {body if len(body) <= 150 else body[:150] + '...'}"
         
-        return "\n".join(output_parts)
+        return "\n".join(_iter_lines())
+
+
+class _WindowsNotificationReader(SystemNotificationReader):
+    """Notification reader for Windows Action Center."""
+    
+    __slots__ = ()
+    
+    def _check_availability(self) -> bool:
+        try:
+            # Check if winsdk is available
+            import winsdk.windows.ui.notifications as notifications
+            return True
+        except ImportError:
+            print("Windows notification reading requires: pip install winsdk")
+            return False
+    
+    def _read_notifications(self, limit: int) -> List[Dict[str, str]]:
+        return self.get_notifications_windows(limit)
+
+
+class _MacNotificationReader(SystemNotificationReader):
+    """Notification reader for macOS Notification Center."""
+    
+    __slots__ = ()
+    
+    def _check_availability(self) -> bool:
+        # Check if notification database exists
+        return MACOS_DB_DIR.exists()
+    
+    def _read_notifications(self, limit: int) -> List[Dict[str, str]]:
+        return self.get_notifications_macos(limit)
+
+
+class _LinuxNotificationReader(SystemNotificationReader):
+    """Notification reader placeholder for Linux."""
+    
+    __slots__ = ()
+    
+    def _check_availability(self) -> bool:
+        # Linux notification reading is complex and varies by desktop environment
+        return False
+    
+    def _read_notifications(self, limit: int) -> List[Dict[str, str]]:
+        return [{
+            'title': 'Not Implemented',
+            'body': 'Linux notification reading not yet implemented',
+            'app': 'System',
+            'timestamp': datetime.now().isoformat()
+        }]
+
+
+_READER_CLASSES = {
+    "Windows": _WindowsNotificationReader,
+    "Darwin": _MacNotificationReader,
+    "Linux": _LinuxNotificationReader,
+}
 
 
 class SystemNotificationSender:
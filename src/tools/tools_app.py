@@ -1,7 +1,6 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi import BackgroundTasks
 from contextlib import asynccontextmanager
-import importlib
 from pathlib import Path
 import sys
 import subprocess
@@ -10,9 +9,41 @@ import os
 import asyncio
 import time
 import logging
+import threading
 import signal
 import atexit
+import mmap
+import functools
+import hashlib
+import tempfile
+from typing import Optional
 import psutil
+from collections import deque
+
+from fastapi.responses import JSONResponse
+
+# orjson parses messages.json and serializes responses several times faster; fall back to stdlib json
+try:
+	import orjson
+	_json_loads = orjson.loads
+
+	class _OrjsonResponse(JSONResponse):
+		"""JSONResponse rendered with orjson."""
+
+		def render(self, content) -> bytes:
+			return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+	_RESPONSE_CLASS = _OrjsonResponse
+except ImportError:
+	def _json_loads(data):
+		return json.loads(bytes(data))
+	_RESPONSE_CLASS = JSONResponse
+
+# ijson lets very large messages.json files be scanned without building the whole list
+try:
+	import ijson
+except ImportError:
+	ijson = None
 
 # Choosing a non-standard port to minimize chance of port collision
 # Setup project root path - go up to the project root (anima-capstone)
@@ -37,18 +68,161 @@ if not logger.handlers:
 	sh.setFormatter(fmt)
 	logger.addHandler(sh)
 
+# Tool modules are imported once here rather than inside each request handler.
+# Listeners with optional third-party dependencies are guarded so a missing
+# package only disables its own endpoint.
+from src.tools.other_listener import weather_info, web_search
+
+# Shared tool clients, built on first use so HTTP sessions are reused across requests
+_WEATHER_FETCHER = None
+_WEB_SEARCHER = None
+_TOOL_CLIENTS_LOCK = threading.Lock()
+
+def _get_weather_fetcher():
+	"""Return the process-wide WeatherFetcher."""
+	global _WEATHER_FETCHER
+	with _TOOL_CLIENTS_LOCK:
+		if _WEATHER_FETCHER is None:
+			_WEATHER_FETCHER = weather_info.WeatherFetcher()
+		return _WEATHER_FETCHER
+
+def _get_web_searcher():
+	"""Return the process-wide WebSearcher."""
+	global _WEB_SEARCHER
+	with _TOOL_CLIENTS_LOCK:
+		if _WEB_SEARCHER is None:
+			_WEB_SEARCHER = web_search.WebSearcher()
+		return _WEB_SEARCHER
+
+try:
+	from src.tools.microsoft_listener import api_fetch
+except Exception as e:
+	api_fetch = None
+	logger.warning(f"[outlook] Microsoft listener unavailable: {e}")
+
+try:
+	from src.tools.google_listener import gmail_api
+except Exception as e:
+	gmail_api = None
+	logger.warning(f"[gmail] Gmail listener unavailable: {e}")
+
+# WhatsApp data flow: a single long-lived Node listener (started at app startup and
+# kept alive by the supervisor task) appends to messages.json; /whatsapp only reads
+# that file and never spawns Node itself.
+
 # Global handle for background Node WhatsApp listener
 WHATSAPP_PROC = None
+# Serializes starts from the supervisor task and request handler threads
+WHATSAPP_START_LOCK = threading.Lock()
+# Set by stop_whatsapp_listener so the supervisor does not restart on purpose-kills
+WHATSAPP_STOP_REQUESTED = False
+# Delay before retrying when the listener could not be launched or keeps crashing
+WHATSAPP_RETRY_SECONDS = 30
+# A listener that exits sooner than this after launch is treated as crash-looping
+WHATSAPP_MIN_UPTIME_SECONDS = 10
+# time.monotonic() of the last listener start or exit, reported by /whatsapp/health
+WHATSAPP_LAST_STATE_CHANGE = time.monotonic()
+# pid of the running listener, maintained on launch/exit so /whatsapp/health needs no poll()
+WHATSAPP_ALIVE_PID = None
 
 def start_whatsapp_listener():
 	"""Start the persistent Node.js WhatsApp listener if not already running."""
-	global WHATSAPP_PROC
+	global WHATSAPP_STOP_REQUESTED
+	with WHATSAPP_START_LOCK:
+		WHATSAPP_STOP_REQUESTED = False
+		_start_whatsapp_listener_locked()
+
+WHATSAPP_LISTENER_DIR = PROJECT_ROOT / "src" / "tools" / "whatsapp_listener"
+WHATSAPP_ENTRY = WHATSAPP_LISTENER_DIR / "index.js"
+# Node stdout/stderr is captured here for debugging
+WHATSAPP_NODE_LOG = WHATSAPP_LISTENER_DIR / "node_output.log"
+# ESM import needs a file:// URL (e.g. file:///E:/anima-capstone/...), fixed for the process lifetime
+_NODE_CMD = [
+	"node",
+	"--input-type=module",
+	"-e",
+	f"import('{WHATSAPP_ENTRY.as_uri()}').then(m=>m.startWhatsAppListener()).catch(e=>console.error(e))"
+]
+# node_output.log is rotated at launch time once it grows past this, keeping a few backups
+WHATSAPP_NODE_LOG_MAX_BYTES = 5_000_000
+WHATSAPP_NODE_LOG_BACKUPS = 3
+# Append handle shared by every listener launch, opened on first start
+_NODE_LOG_FILE = None
+# With several uvicorn workers only the process holding this lock runs the Node listener;
+# the others just read messages.json. It lives in the temp dir (one per checkout) so the
+# source tree stays clean.
+WHATSAPP_LEADER_LOCK_FILE = Path(tempfile.gettempdir()) / (
+	f"anima-whatsapp-{hashlib.sha1(str(PROJECT_ROOT).encode()).hexdigest()[:12]}.lock"
+)
+# Open handle on the lock file while this process is the leader
+_LEADER_LOCK_HANDLE = None
+
+def _acquire_listener_leadership() -> bool:
+	"""Try to become the worker that owns the Node listener.
+
+	Uses a non-blocking OS file lock, released automatically when the owning
+	process exits, so a surviving worker can take over on its next attempt.
+
+	Returns:
+		True if this process holds the lock
+	"""
+	global _LEADER_LOCK_HANDLE
+	if _LEADER_LOCK_HANDLE is not None:
+		return True
+	handle = open(WHATSAPP_LEADER_LOCK_FILE, "a+")
+	try:
+		if sys.platform == "win32":
+			import msvcrt
+			handle.seek(0)
+			msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+		else:
+			import fcntl
+			fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+	except OSError:
+		handle.close()
+		return False
+	_LEADER_LOCK_HANDLE = handle
+	logger.info(f"[whatsapp] this worker (pid={os.getpid()}) owns the listener")
+	return True
+
+def _rotate_node_log():
+	"""Shift node_output.log to .1, .2, ... dropping the oldest backup."""
+	for i in range(WHATSAPP_NODE_LOG_BACKUPS - 1, 0, -1):
+		src = WHATSAPP_NODE_LOG.with_name(f"{WHATSAPP_NODE_LOG.name}.{i}")
+		if src.exists():
+			os.replace(src, WHATSAPP_NODE_LOG.with_name(f"{WHATSAPP_NODE_LOG.name}.{i + 1}"))
+	os.replace(WHATSAPP_NODE_LOG, WHATSAPP_NODE_LOG.with_name(f"{WHATSAPP_NODE_LOG.name}.1"))
+
+def _node_log_file():
+	"""Return the shared append handle for node_output.log, rotating it when too large.
+
+	Only called right before a launch, when no listener holds the file open.
+	"""
+	global _NODE_LOG_FILE
+	try:
+		oversized = WHATSAPP_NODE_LOG.stat().st_size > WHATSAPP_NODE_LOG_MAX_BYTES
+	except FileNotFoundError:
+		oversized = False
+	if oversized:
+		if _NODE_LOG_FILE is not None:
+			_NODE_LOG_FILE.close()
+		try:
+			_rotate_node_log()
+		except OSError as e:
+			logger.warning(f"[whatsapp] could not rotate {WHATSAPP_NODE_LOG}: {e}")
+	if _NODE_LOG_FILE is None or _NODE_LOG_FILE.closed:
+		_NODE_LOG_FILE = open(WHATSAPP_NODE_LOG, "a", encoding="utf-8")
+	return _NODE_LOG_FILE
+
+def _start_whatsapp_listener_locked():
+	"""Launch the listener process; caller must hold WHATSAPP_START_LOCK."""
+	global WHATSAPP_PROC, WHATSAPP_LAST_STATE_CHANGE, WHATSAPP_ALIVE_PID
 	if WHATSAPP_PROC and WHATSAPP_PROC.poll() is None:
 		return  # already running
-	listener_dir = PROJECT_ROOT / "src" / "tools" / "whatsapp_listener"
-	entry = listener_dir / "index.js"
-	if not entry.exists():
-		print(f"[whatsapp] index.js not found at {entry}")
+	if not _acquire_listener_leadership():
+		return  # another worker runs the listener
+	if not WHATSAPP_ENTRY.exists():
+		print(f"[whatsapp] index.js not found at {WHATSAPP_ENTRY}")
 		return
 	creationflags = 0
 	startupinfo = None
@@ -58,33 +232,32 @@ def start_whatsapp_listener():
 		startupinfo.wShowWindow = subprocess.SW_HIDE
 		creationflags = subprocess.CREATE_NO_WINDOW
 	try:
-		# Convert Windows path to file:// URL for ESM import
-		from pathlib import Path
-		file_url = entry.as_uri()  # Converts to file:///E:/anima-capstone/...
-		node_cmd = [
-			"node",
-			"--input-type=module",
-			"-e",
-			f"import('{file_url}').then(m=>m.startWhatsAppListener()).catch(e=>console.error(e))"
-		]
-		# Capture output to log file for debugging
-		node_log = listener_dir / "node_output.log"
-		log_file = open(node_log, "a", encoding="utf-8")
 		WHATSAPP_PROC = subprocess.Popen(
-			node_cmd,
-			cwd=str(listener_dir),
-			stdout=log_file,
+			_NODE_CMD,
+			cwd=str(WHATSAPP_LISTENER_DIR),
+			stdout=_node_log_file(),
 			stderr=subprocess.STDOUT,
 			startupinfo=startupinfo,
 			creationflags=creationflags
 		)
-		logger.info(f"[whatsapp] listener started pid={WHATSAPP_PROC.pid}, log: {node_log}")
+		WHATSAPP_LAST_STATE_CHANGE = time.monotonic()
+		WHATSAPP_ALIVE_PID = WHATSAPP_PROC.pid
+		logger.info(f"[whatsapp] listener started pid={WHATSAPP_PROC.pid}, log: {WHATSAPP_NODE_LOG}")
 	except Exception as e:
 			logger.error(f"[whatsapp] failed to start listener: {e}")
 
 def stop_whatsapp_listener():
-	"""Terminate the Node.js WhatsApp listener if running."""
-	global WHATSAPP_PROC
+	"""Terminate the Node.js WhatsApp listener if running.
+
+	On a follower worker this only does something when no leader is left: it then takes
+	the leader lock and sweeps the orphaned Node processes. While a leader is alive the
+	listener is still managed, and the leader stops it when it shuts down.
+	"""
+	global WHATSAPP_PROC, WHATSAPP_STOP_REQUESTED, WHATSAPP_ALIVE_PID
+	WHATSAPP_STOP_REQUESTED = True
+	WHATSAPP_ALIVE_PID = None
+	if _LEADER_LOCK_HANDLE is None and not _acquire_listener_leadership():
+		return  # follower worker with a live leader: the listener belongs to the leader
 	
 	terminated_pids = []
 	
@@ -153,31 +326,42 @@ def stop_whatsapp_listener():
 
 RESTART_COUNT = 0
 
-async def _heartbeat_task():
-	global RESTART_COUNT
+async def _supervisor_task():
+	"""Restart the WhatsApp listener as soon as it exits, without periodic polling."""
+	global RESTART_COUNT, WHATSAPP_LAST_STATE_CHANGE, WHATSAPP_ALIVE_PID
 	while True:
-		await asyncio.sleep(30)
-		# poll() returns None if process is still running, non-None exit code if terminated
-		alive = WHATSAPP_PROC is not None and WHATSAPP_PROC.poll() is None
-		if alive:
-			pid = WHATSAPP_PROC.pid if WHATSAPP_PROC else None
-			logger.info(f"[whatsapp] heartbeat ok pid={pid}")
+		proc = WHATSAPP_PROC
+		if proc is None:
+			# Launch failed (e.g. node missing); try again later
+			await asyncio.sleep(WHATSAPP_RETRY_SECONDS)
 		else:
-			logger.warning("[whatsapp] process not running, attempting restart")
-			start_whatsapp_listener()
-			# Check again after restart attempt
-			if WHATSAPP_PROC is not None and WHATSAPP_PROC.poll() is None:
-				RESTART_COUNT += 1
-				logger.info(f"[whatsapp] restart successful (count={RESTART_COUNT})")
+			# Popen.wait blocks until exit, so park it in a worker thread
+			started_at = time.monotonic()
+			code = await asyncio.to_thread(proc.wait)
+			WHATSAPP_LAST_STATE_CHANGE = time.monotonic()
+			if WHATSAPP_ALIVE_PID == proc.pid:
+				WHATSAPP_ALIVE_PID = None
+			if WHATSAPP_STOP_REQUESTED:
+				return
+			logger.warning(f"[whatsapp] listener exited with code {code}, restarting")
+			if time.monotonic() - started_at < WHATSAPP_MIN_UPTIME_SECONDS:
+				await asyncio.sleep(WHATSAPP_RETRY_SECONDS)
+		if WHATSAPP_STOP_REQUESTED:
+			return
+		# Popen and the log rotation block, so launch from a worker thread
+		await asyncio.to_thread(start_whatsapp_listener)
+		if WHATSAPP_PROC is not None and WHATSAPP_PROC.poll() is None:
+			RESTART_COUNT += 1
+			logger.info(f"[whatsapp] restart successful (count={RESTART_COUNT})")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-	start_whatsapp_listener()
-	heartbeat = asyncio.create_task(_heartbeat_task())
+	await asyncio.to_thread(start_whatsapp_listener)
+	supervisor = asyncio.create_task(_supervisor_task())
 	try:
 		yield
 	finally:
-		heartbeat.cancel()
+		supervisor.cancel()
 		stop_whatsapp_listener()
 
 # Cleanup handlers for script termination
@@ -197,7 +381,7 @@ atexit.register(cleanup_on_exit)
 signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=_RESPONSE_CLASS)
 
 # Shutdown endpoint
 @app.post("/shutdown")
@@ -205,6 +389,9 @@ def shutdown():
 	"""
 	Gracefully shutdown the server and clean up all background processes.
 	This endpoint stops the WhatsApp listener and prepares for server termination.
+	With several workers, a follower that receives this leaves the listener to the
+	leader, which stops it when its own process is terminated; if the leader is
+	already gone the follower sweeps the orphaned listener itself.
 	"""
 	logger.info("[shutdown] Shutdown endpoint called, cleaning up...")
 	stop_whatsapp_listener()
@@ -218,24 +405,46 @@ GMAIL_CREDENTIALS_PATH = PROJECT_ROOT / "src" / "tools" / "google_listener" / "g
 GMAIL_TOKEN_PATH = PROJECT_ROOT  / "token.pickle"
 
 @app.get("/gmail")
-def get_gmail():
+def get_gmail(offset: int = Query(0, ge=0), page_size: Optional[int] = Query(None, ge=1, le=100), body_max_chars: int = 0):
 	"""
-	Returns a list of new unread emails (subject, body, sender) from Gmail.
+	Returns new unread emails (subject, body, sender) from Gmail, optionally one page at a time.
 	Authenticates using gcp_credential.json and token.pickle in google_listener.
-	Marks emails as read after fetching.
+
+	Query params:
+	- offset: index of the first email to return (default 0)
+	- page_size: number of emails per page, 1–100 (default: every email from offset on)
+	- body_max_chars: truncate bodies to this many characters for previews; 0 or less (default) returns full bodies
+
+	Returns:
+	- emails: the requested page
+	- total_count: number of unread emails
+	- next_offset: offset of the next page, or null on the last page
 	"""
 	try:
-		gmail_api = importlib.import_module("src.tools.google_listener.gmail_api")
+		if gmail_api is None:
+			raise RuntimeError("Gmail listener module could not be imported")
 		service = gmail_api.authenticate_gmail(str(GMAIL_CREDENTIALS_PATH), str(GMAIL_TOKEN_PATH))
-		emails = gmail_api.get_new_email_subject_and_body(service)
-		return {"status": "success", "emails": emails}
+		# Only the requested page is downloaded; the id listing alone gives the total
+		ids = gmail_api.list_unread_ids(service)
+		end = len(ids) if page_size is None else offset + page_size
+		emails = gmail_api.get_new_email_subject_and_body(
+			service, ids[offset:end], body_max_chars=body_max_chars if body_max_chars > 0 else None
+		)
+		return {
+			"status": "success",
+			"emails": emails,
+			"total_count": len(ids),
+			"next_offset": end if end < len(ids) else None
+		}
 	except Exception as e:
 		logger.error(f"[gmail] error: {e}")
 		raise HTTPException(status_code=500, detail=str(e))
 	
 # New Outlook endpoint - returns emails, events, and tasks
+OUTLOOK_PARTS = ("emails", "events", "tasks")
+
 @app.get("/outlook")
-def get_outlook():
+async def get_outlook(include: str = Query(",".join(OUTLOOK_PARTS), description="Comma-separated subset of emails,events,tasks to fetch")):
 	"""Aggregate Microsoft 365 data.
 
 	Returns a JSON payload combining:
@@ -248,21 +457,31 @@ def get_outlook():
 	Notes:
 	- Uses OAuth via the `login` helper and Microsoft Graph.
 	- Each call may return empty lists if nothing new or if Graph is unreachable.
+	- Parts left out of `include` are not fetched and come back as empty lists,
+	  so e.g. checking events does not mark new emails as seen.
 
 	Examples:
 	- http://127.0.0.1:8576/get_outlook
+	- http://127.0.0.1:8576/get_outlook?include=events,tasks
 	"""
-	'''
-	
-	'''
+	parts = [p for p in OUTLOOK_PARTS if p in {x.strip() for x in include.lower().split(",")}]
+	if not parts:
+		raise HTTPException(status_code=400, detail=f"include must name at least one of: {', '.join(OUTLOOK_PARTS)}")
 	try:
-		api_fetch = importlib.import_module("src.tools.microsoft_listener.api_fetch")
-		emails = api_fetch.get_new_emails()
-		events_data = api_fetch.get_upcoming_events()
-		tasks_data = api_fetch.get_pending_tasks()
+		if api_fetch is None:
+			raise RuntimeError("Microsoft listener module could not be imported")
+		fetchers = {
+			"emails": api_fetch.get_new_emails,
+			"events": api_fetch.get_upcoming_events,
+			"tasks": api_fetch.get_pending_tasks
+		}
+		# The Graph fetchers are blocking; run the requested ones concurrently off the event loop
+		results = dict(zip(parts, await asyncio.gather(*(asyncio.to_thread(fetchers[p]) for p in parts))))
+		events_data = results.get("events", {})
+		tasks_data = results.get("tasks", {})
 		return {
 			"status": "success",
-			"emails": emails,
+			"emails": results.get("emails", []),
 			"events": events_data.get("events", []),
 			"reminders": events_data.get("reminders", []),
 			"tasks": tasks_data.get("tasks", []),
@@ -271,39 +490,66 @@ def get_outlook():
 	except Exception as e:
 		raise HTTPException(status_code=500, detail=str(e))
 	
+# Upper bounds for the /weather and /search size parameters
+WEATHER_MAX_DAYS = 7
+SEARCH_MAX_RESULTS = 20
+
+# Forecasts change at most hourly, so a fetched payload is reused for this long
+WEATHER_CACHE_TTL_SECONDS = 600
+# (normalized city, days) -> (expires_at, weather data)
+_WEATHER_CACHE: dict = {}
+_WEATHER_CACHE_LOCK = threading.Lock()
+
+def _get_cached_weather(city: str, days: int):
+	"""Return weather data for a city, serving repeat requests from a short TTL cache.
+
+	Error payloads (e.g. unknown city) are returned but never cached.
+	"""
+	key = (city.strip().lower(), days)
+	now = time.monotonic()
+	with _WEATHER_CACHE_LOCK:
+		entry = _WEATHER_CACHE.get(key)
+	if entry and entry[0] > now:
+		return entry[1]
+	data = _get_weather_fetcher().get_weather_by_location(city, forecast_days=days)
+	if isinstance(data, dict) and not data.get("error"):
+		with _WEATHER_CACHE_LOCK:
+			# Drop expired entries so the cache only holds recently requested cities
+			for k in [k for k, (expires, _) in _WEATHER_CACHE.items() if expires <= now]:
+				del _WEATHER_CACHE[k]
+			_WEATHER_CACHE[key] = (now + WEATHER_CACHE_TTL_SECONDS, data)
+	return data
+
 # Weather info endpoint - requires city, optional days & formatted
 @app.get("/weather")
-def get_weather(city: str, days: int = 1, formatted: bool = False):
+async def get_weather(response: Response, city: str, days: int = Query(1, ge=1, le=WEATHER_MAX_DAYS), formatted: bool = False):
 	"""Fetch weather for a city using Open‑Meteo.
 
 	Query params:
 	- city: required city name (e.g., "Sydney", "New York")
-	- days: optional forecast length (1–7, clamped)
+	- days: optional forecast length (1–7; out-of-range values are rejected with 422)
 	- formatted: when true, returns a human‑readable summary string; otherwise returns structured JSON.
 
 	Behavior:
 	- Geocodes the city, then fetches current + daily forecast.
+	- Results are cached per city/days for 10 minutes (also advertised via Cache-Control).
 	- On error (city not found or network issues), returns HTTP 404/500.
 
 	Examples:
 	- JSON:      http://127.0.0.1:8576/weather?city=Sydney&days=3
 	- Formatted: http://127.0.0.1:8576/weather?city=New%20York&days=2&formatted=true
 	"""
-	'''
-	
-	'''
 	try:
-		weather_info = importlib.import_module("src.tools.other_listener.weather_info")
-		# Clamp days between 1 and 7 for reasonable responses
-		days = max(1, min(days, 7))
+		# Geocoding and forecast calls use blocking requests, so run them in a worker thread
+		data = await asyncio.to_thread(_get_cached_weather, city, days)
+		if isinstance(data, dict) and not data.get("error"):
+			response.headers["Cache-Control"] = f"public, max-age={WEATHER_CACHE_TTL_SECONDS}"
 		if formatted:
 			# Return a readable string combining current + forecast
-			text = weather_info.get_weather_forecast(city, days=days)
+			fetcher = _get_weather_fetcher()
+			text = f"{fetcher.format_current_weather(data)}\n\n{fetcher.format_forecast(data, days)}"
 			return {"city": city, "days": days, "formatted": True, "text": text}
 		else:
-			# Return structured JSON using WeatherFetcher
-			fetcher = weather_info.WeatherFetcher()
-			data = fetcher.get_weather_by_location(city, forecast_days=days)
 			if isinstance(data, dict) and data.get("error"):
 				raise HTTPException(status_code=404, detail=data["error"])
 			return data
@@ -312,14 +558,20 @@ def get_weather(city: str, days: int = 1, formatted: bool = False):
 	except Exception as e:
 		raise HTTPException(status_code=500, detail=str(e))
 
+@functools.lru_cache(maxsize=64)
+def _normalize_region(region: str) -> str:
+	"""Canonicalize a DuckDuckGo region code (e.g. " US-en " -> "us-en")."""
+	# ddg expects patterns like 'us-en', 'au-en', 'wt-wt'
+	return (region or "wt-wt").strip().lower() or "wt-wt"
+
 # Web search endpoint
 @app.get("/search")
-def search(query: str, max_results: int = 5, formatted: bool = False, region: str = "wt-wt"):
+async def search(query: str, max_results: int = Query(5, ge=1, le=SEARCH_MAX_RESULTS), formatted: bool = False, region: str = "wt-wt"):
 	"""DuckDuckGo web search.
 
 	Query params:
 	- query: required search text
-	- max_results: 1–20, clamped
+	- max_results: 1–20; out-of-range values are rejected with 422
 	- region: locale bias (e.g., "us-en", "au-en", "wt-wt")
 	- formatted: when true, returns formatted text; otherwise returns list of results.
 
@@ -331,55 +583,134 @@ def search(query: str, max_results: int = 5, formatted: bool = False, region: st
 	- JSON:      http://127.0.0.1:8576/search?query=best%20coffee&max_results=5&region=au-en
 	- Formatted: http://127.0.0.1:8576/search?query=fastapi%20tutorial&formatted=true&region=us-en
 	"""
-	'''
-	
-	'''
 	try:
-		web_search_mod = importlib.import_module("src.tools.other_listener.web_search")
-		max_results = max(1, min(max_results, 20))
-		# basic region sanity: ddg expects patterns like 'us-en', 'au-en', 'wt-wt'
-		region = (region or "wt-wt").strip()
+		region = _normalize_region(region)
 		if formatted:
-			# Use helper with region support
-			text = web_search_mod.web_search(query, max_results=max_results, region=region)
+			text = await asyncio.to_thread(
+				_get_web_searcher().search_formatted, query, max_results=max_results, region=region
+			)
 			return {"query": query, "formatted": True, "text": text}
 		else:
-			searcher = web_search_mod.WebSearcher()
-			results = searcher.search(query, max_results=max_results, region=region)
+			# search_async also shares one DDGS call between identical concurrent requests
+			results = await _get_web_searcher().search_async(query, max_results=max_results, region=region)
 			return {"query": query, "results": results}
 	except Exception as e:
 		raise HTTPException(status_code=500, detail=str(e))
 
+WHATSAPP_MESSAGES_FILE = WHATSAPP_LISTENER_DIR / "messages.json"
+# Files at least this large are parsed straight from a read-only mapping instead of a bytes copy
+WHATSAPP_MMAP_MIN_BYTES = 1 << 20
+# Files at least this large are stream-parsed (when ijson is installed), keeping only the tail
+WHATSAPP_STREAM_MIN_BYTES = 8 << 20
+# Number of most recent messages returned by /whatsapp
+WHATSAPP_RECENT_LIMIT = 20
+# ((st_mtime_ns, st_size), /whatsapp response body) built from the last messages.json read
+_MSG_CACHE: tuple = (None, None)
+
+def _read_json_file(path: Path, size: int):
+	"""Parse a JSON file, memory-mapping it when it is large.
+
+	The mapping is only held for the duration of the parse, so the listener
+	can keep rewriting the file.
+	"""
+	if size < WHATSAPP_MMAP_MIN_BYTES:
+		return _json_loads(path.read_bytes())
+	with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+		view = memoryview(mm)
+		try:
+			return _json_loads(view)
+		finally:
+			view.release()
+
+def _build_whatsapp_payload(data):
+	"""Build the /whatsapp response body from parsed messages.json content."""
+	if isinstance(data, list):
+		recent = data[-WHATSAPP_RECENT_LIMIT:]
+		return {"messages": recent, "count": len(recent)}
+	elif isinstance(data, dict) and "messages" in data:
+		msgs = data.get("messages", [])
+		recent = msgs[-WHATSAPP_RECENT_LIMIT:] if isinstance(msgs, list) else []
+		return {"messages": recent, "count": len(recent)}
+	else:
+		return {"messages": [], "count": 0, "status": "unexpected format"}
+
+def _stream_whatsapp_payload(path: Path):
+	"""Build the /whatsapp response body by streaming messages.json with ijson.
+
+	Only the last WHATSAPP_RECENT_LIMIT messages are held in memory. Returns
+	None when the layout is not one the streaming path recognises, so the
+	caller can fall back to a full parse.
+	"""
+	with open(path, "rb") as f:
+		head = f.read(64).lstrip()[:1]
+		if head == b"[":
+			prefix = "item"
+		elif head == b"{":
+			prefix = "messages.item"
+		else:
+			return None
+		f.seek(0)
+		recent = list(deque(ijson.items(f, prefix, use_float=True), maxlen=WHATSAPP_RECENT_LIMIT))
+	if not recent and prefix != "item":
+		# Empty or missing "messages" key; let the full parse decide which it is
+		return None
+	return {"messages": recent, "count": len(recent)}
+
+def _whatsapp_etag(key) -> str:
+	"""Build an ETag from a messages.json (st_mtime_ns, st_size) key."""
+	return f'"{key[0]:x}-{key[1]:x}"'
+
+def _load_whatsapp_payload():
+	"""Return (etag, /whatsapp response body), re-reading messages.json only when it changed.
+
+	Only the built payload is kept, so the full message history is not held
+	in memory between reads. The ETag is None while the file does not exist.
+	"""
+	global _MSG_CACHE
+	try:
+		st = WHATSAPP_MESSAGES_FILE.stat()
+	except FileNotFoundError:
+		return None, {"messages": [], "count": 0, "status": "listener starting or no messages yet"}
+	key = (st.st_mtime_ns, st.st_size)
+	cached_key, cached_payload = _MSG_CACHE
+	if key == cached_key:
+		return _whatsapp_etag(key), cached_payload
+	payload = None
+	if ijson is not None and st.st_size >= WHATSAPP_STREAM_MIN_BYTES:
+		payload = _stream_whatsapp_payload(WHATSAPP_MESSAGES_FILE)
+	if payload is None:
+		payload = _build_whatsapp_payload(_read_json_file(WHATSAPP_MESSAGES_FILE, st.st_size))
+	_MSG_CACHE = (key, payload)
+	return _whatsapp_etag(key), payload
+
 @app.get("/whatsapp")
-def get_whatsapp():
+async def get_whatsapp(request: Request, response: Response):
 	"""Return collected WhatsApp messages from the persistent Node listener.
 
 	Behavior:
-	- Ensures the background Node process is running (auto‑restart if down).
+	- On the leader worker, ensures the background Node process is running (auto‑restart if down).
 	- Reads `messages.json` written by the listener and returns messages with count.
 	- If no messages yet or file missing, returns an empty list and status note.
+	- Sends an ETag derived from the file's mtime/size; a matching If-None-Match gets a 304.
 
 	Examples:
 	- http://127.0.0.1:8576/whatsapp
 	"""
 	try:
-		# Ensure listener running (auto-restart if crashed)
-		start_whatsapp_listener()
-		messages_file = PROJECT_ROOT / "src" / "tools" / "whatsapp_listener" / "messages.json"
-		if not messages_file.exists():
-			return {"messages": [], "count": 0, "status": "listener starting or no messages yet"}
+		# The supervisor restarts crashed listeners as soon as they exit; only start one here
+		# when the leader has nothing running (e.g. the supervisor is backing off after a
+		# failed launch). Followers never own the listener and leave takeover to their
+		# supervisor's lock retries.
+		if _LEADER_LOCK_HANDLE is not None and (WHATSAPP_PROC is None or WHATSAPP_PROC.poll() is not None):
+			await asyncio.to_thread(start_whatsapp_listener)
 		try:
-			with messages_file.open("r", encoding="utf-8") as f:
-				data = json.load(f)
-			if isinstance(data, list):
-				recent = data[-20:]
-				return {"messages": recent, "count": len(recent)}
-			elif isinstance(data, dict) and "messages" in data:
-				msgs = data.get("messages", [])
-				recent = msgs[-20:] if isinstance(msgs, list) else []
-				return {"messages": recent, "count": len(recent)}
-			else:
-				return {"messages": [], "count": 0, "status": "unexpected format"}
+			etag, payload = await asyncio.to_thread(_load_whatsapp_payload)
+			if etag is None:
+				return payload
+			if request.headers.get("if-none-match") == etag:
+				return Response(status_code=304, headers={"ETag": etag})
+			response.headers["ETag"] = etag
+			return payload
 		except Exception as read_err:
 			raise HTTPException(status_code=500, detail=f"Failed reading messages: {read_err}")
 	except Exception as e:
@@ -392,17 +723,21 @@ def whatsapp_health():
 	Returns:
 	- running: boolean indicating process state
 	- pid: OS process id when running
-	- restart_count: number of auto‑restarts performed by heartbeat
+	- restart_count: number of auto‑restarts performed by the supervisor
+	- seconds_since_state_change: time since the listener last started or exited
+	- leader: whether this worker process owns the listener
 
 	Examples:
 	- http://127.0.0.1:8576/whatsapp/health
 	"""
-	alive = WHATSAPP_PROC is not None and WHATSAPP_PROC.poll() is None
-	pid = WHATSAPP_PROC.pid if alive and WHATSAPP_PROC is not None else None
+	# Read the state kept by the launcher/supervisor instead of polling the process
+	pid = WHATSAPP_ALIVE_PID
 	return {
-		"running": bool(alive),
+		"running": pid is not None,
 		"pid": pid,
-		"restart_count": RESTART_COUNT
+		"restart_count": RESTART_COUNT,
+		"seconds_since_state_change": round(time.monotonic() - WHATSAPP_LAST_STATE_CHANGE, 1),
+		"leader": _LEADER_LOCK_HANDLE is not None
 	}
 
 # Root endpoint
@@ -19,15 +19,22 @@ How to run:
 import sys, json, random
 from pathlib import Path
 from PySide6 import QtCore, QtGui, QtWidgets
-from PySide6.QtWidgets import QDialog
 from PySide6.QtCore import QThread, Signal
 import math
 import os
-import psutil
-import requests
-sys.path.append(str(Path(__file__).parent.parent.parent))
+import threading
+import time
+from functools import lru_cache
+
+# orjson parses config.json several times faster on startup; fall back to stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 CONFIG_PATH = Path(__file__).parent.parent.parent / "config.json"
+@lru_cache(maxsize=1)
 def load_config():
     """Load configuration from config.json or use defaults"""
     default_config = {
@@ -61,10 +68,9 @@ def load_config():
     
     if CONFIG_PATH.exists():
         try:
-            with open(CONFIG_PATH, 'r') as f:
-                config = json.load(f)
-                print("✅ Loaded configuration from config.json")
-                return config
+            config = _json_loads(CONFIG_PATH.read_bytes())
+            print("✅ Loaded configuration from config.json")
+            return config
         except Exception as e:
             print(f"⚠️ Error loading config: {e}")
             print("Using default configuration")
@@ -78,15 +84,302 @@ def load_config():
 CONFIG = load_config()
 
 # ---------------------- Configuration ----------------------
-CHARACTER_GIF = str(Path(__file__).parent.parent.parent / CONFIG["ui"]["character_gif"])  # Use the path from config.json
+_UI_CONFIG = CONFIG.get("ui", {})
+CHARACTER_GIF = str(Path(__file__).parent.parent.parent / _UI_CONFIG.get("character_gif", "assets/expression1.gif"))  # Use the path from config.json
 print("Character GIF path:", CHARACTER_GIF)
-WANDER_INTERVAL_MS = 5000
-WINDOW_OPACITY = 0.95
-MOVE_STEP = 20 # pixels per wander step
-SIZE_MODE = CONFIG["ui"].get("size_mode", "Fixed Size")
-CONFIG_WINDOW_W, CONFIG_WINDOW_H = CONFIG["ui"].get("window_size", [200, 200])
+WANDER_INTERVAL_MS = int(_UI_CONFIG.get("wander_interval_ms", 5000))
+WINDOW_OPACITY = float(_UI_CONFIG.get("window_opacity", 0.95))
+MOVE_STEP = int(_UI_CONFIG.get("move_step", 20)) # pixels per wander step
+WANDER_TABLE_SIZE = 256 # precomputed random velocities per refill (power of two)
+WANDER_ANIMATION_MS = 1250 # longest glide per wander step (the full jump GIF); capped by the wander interval
+SYSTEM_MOVE_SETTLE_MS = 300 # idle time after a native drag before it counts as finished
+SYSTEM_MOVE_MAX_IDLE_CHECKS = 10 # settle checks with the button reported held before giving up
+DRAG_MOVE_INTERVAL_MS = 16 # fallback drag applies at most one move() per ~60 Hz frame
+USER_IDLE_SECONDS = 30 # pause wandering after this long without keyboard/mouse input
+IDLE_CHECK_MS = 5000
+SIZE_MODE = _UI_CONFIG.get("size_mode", "Fixed Size")
+CONFIG_WINDOW_W, CONFIG_WINDOW_H = _UI_CONFIG.get("window_size", [200, 200])
+DEFAULT_FRAME_DELAY_MS = 100 # used when a GIF frame carries no delay
+MENU_GLYPH_SIZE = 32 # side of the pre-rendered circular-menu emoji icons
+SYSTEM_PROMPT = CONFIG.get("llm", {}).get("system_prompt")
 # -----------------------------------------------------------
-class QuestionBubble(QtWidgets.QDialog):
+
+# Window flags shared by the character, its menu buttons and bubbles (combined once)
+_OVERLAY_WINDOW_FLAGS = QtCore.Qt.FramelessWindowHint | QtCore.Qt.WindowStaysOnTopHint | QtCore.Qt.Tool
+_TRAY_TRIGGER = QtWidgets.QSystemTrayIcon.ActivationReason.Trigger
+
+# Style sheets, shared so each is written once
+_QUESTION_LABEL_QSS = """
+QLabel {
+    background: transparent;
+    color: #222;
+    font-size: 16px;
+    font-weight: bold;
+}
+"""
+_QUESTION_INPUT_QSS = """
+QLineEdit {
+    background: white;
+    border: 2px solid #4a90e2;
+    border-radius: 8px;
+    padding: 8px 12px;
+    font-size: 15px;
+    color: #222;
+}
+QLineEdit:focus {
+    border: 2px solid #357abd;
+}
+"""
+_CHAT_QSS = """
+QLabel {
+    background: transparent;
+    color: #222;
+    font-size: 15px;
+    font-weight: bold;
+    padding: 0px;
+}
+"""
+_TOOLS_TITLE_QSS = "font-size: 16px; font-weight: bold; padding: 10px;"
+_MENU_BUTTON_QSS = """
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                stop:0 #4a90e2, stop:1 #357abd);
+    border: 3px solid white;
+    border-radius: 30px;
+    color: white;
+    font-size: 24px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                stop:0 #5ba3ff, stop:1 #4a90e2);
+    border: 3px solid #ffe082;
+}
+QPushButton:pressed {
+    background: #2d5f8d;
+}
+"""
+
+# Circular menu buttons at 10, 11, and 12 o'clock: (angle_degrees, label, glyph, handler name)
+# Angles: 240° (10 o'clock), 270° (12 o'clock), 300° (11 o'clock)
+_MENU_BUTTONS = (
+    (360, "Prompt", "💬", "_on_prompt_click"),
+    (310, "Move", "✋", "_on_move_click"),
+    (260, "Close", "❌", "_on_quick_close_click"),
+    (210, "Tools", "🔧", "_on_tools_click"),
+)
+MENU_RADIUS = 110  # Closer distance to keep buttons over the GIF
+MENU_BUTTON_SIZE = 60
+# Top-left offset of each menu button from the character's centre, fixed by the table above
+_MENU_OFFSETS = tuple(
+    (
+        round(MENU_RADIUS * math.cos(math.radians(angle - 90)) - MENU_BUTTON_SIZE / 2),  # -90 to start from top
+        round(MENU_RADIUS * math.sin(math.radians(angle - 90)) - MENU_BUTTON_SIZE / 2),
+    )
+    for angle, *_ in _MENU_BUTTONS
+)
+
+# Frame delays per decoded GIF/size; the pixmaps themselves live in QPixmapCache
+_FRAME_DELAYS = {}
+
+
+def load_scaled_frames(path: str, size: QtCore.QSize):
+    """
+    Decode every frame of an animated image straight to the target size.
+
+    Frames are kept in QPixmapCache keyed by path, mtime and size, so re-applying
+    the same size mode (show, resize retries) does not decode the file again.
+
+    Args:
+        path: Path to the GIF (or other animated image).
+        size: Box to fit the frames into, keeping aspect ratio.
+
+    Returns:
+        List of (QPixmap, delay_ms) tuples; empty if the file cannot be decoded.
+    """
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return []
+
+    key_base = f"{path}|{mtime}|{size.width()}x{size.height()}"
+    delays = _FRAME_DELAYS.get(key_base)
+    if delays is not None:
+        cached = [QtGui.QPixmapCache.find(f"{key_base}|{i}") for i in range(len(delays))]
+        if all(pix is not None and not pix.isNull() for pix in cached):
+            return list(zip(cached, delays))
+
+    reader = QtGui.QImageReader(path)
+    src_size = reader.size()
+    if src_size.isValid():
+        # Let the decoder scale while reading instead of scaling each frame at playback
+        reader.setScaledSize(src_size.scaled(size, QtCore.Qt.KeepAspectRatio))
+
+    frames = []
+    while True:
+        image = reader.read()
+        if image.isNull():
+            break
+        pix = QtGui.QPixmap.fromImage(image)
+        QtGui.QPixmapCache.insert(f"{key_base}|{len(frames)}", pix)
+        delay = reader.nextImageDelay()
+        frames.append((pix, delay if delay > 0 else DEFAULT_FRAME_DELAY_MS))
+    _FRAME_DELAYS[key_base] = [delay for _, delay in frames]
+    return frames
+
+
+def system_idle_seconds():
+    """
+    Seconds since the user last touched the keyboard or mouse anywhere on the desktop.
+
+    Returns:
+        Idle time in seconds, or None when the platform offers no way to query it.
+    """
+    if sys.platform != "win32":
+        return None
+    import ctypes
+    from ctypes import wintypes
+
+    class LASTINPUTINFO(ctypes.Structure):
+        _fields_ = [("cbSize", wintypes.UINT), ("dwTime", wintypes.DWORD)]
+
+    info = LASTINPUTINFO()
+    info.cbSize = ctypes.sizeof(info)
+    if not ctypes.windll.user32.GetLastInputInfo(ctypes.byref(info)):
+        return None
+    # Both counters are milliseconds since boot and wrap at 2**32
+    elapsed_ms = (ctypes.windll.kernel32.GetTickCount() - info.dwTime) & 0xFFFFFFFF
+    return elapsed_ms / 1000.0
+
+
+@lru_cache(maxsize=32)
+def _bubble_background(width, height, tail_height, dpr):
+    """
+    Rasterize the manga-style bubble (outline, tail and inner shadow) once per size.
+
+    Args:
+        width, height: Bubble widget size in logical pixels, tail included.
+        tail_height:   Height of the tail pointing down to the character.
+        dpr:           Device pixel ratio of the screen the bubble is shown on.
+
+    Returns:
+        Transparent QPixmap with the bubble chrome, ready to blit in paintEvent.
+    """
+    pix = QtGui.QPixmap(QtCore.QSize(round(width * dpr), round(height * dpr)))
+    pix.setDevicePixelRatio(dpr)
+    pix.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(pix)
+    painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+    
+    # Bubble dimensions
+    bubble_rect = QtCore.QRectF(0, 0, width, height - tail_height)
+    
+    # Create path for bubble with tail
+    path = QtGui.QPainterPath()
+    
+    # Main bubble (rounded rectangle)
+    path.addRoundedRect(bubble_rect, 15, 15)
+    
+    # Tail (pointing down to character)
+    tail_start_x = width / 2 - 15
+    tail_tip_x = width / 2
+    tail_end_x = width / 2 + 15
+    tail_start_y = height - tail_height
+    tail_tip_y = height
+    
+    tail = QtGui.QPolygonF([
+        QtCore.QPointF(tail_start_x, tail_start_y),
+        QtCore.QPointF(tail_tip_x, tail_tip_y),
+        QtCore.QPointF(tail_end_x, tail_start_y),
+    ])
+    path.addPolygon(tail)
+    path.closeSubpath()
+    
+    # Draw white fill with black outline (classic manga style)
+    painter.setPen(QtGui.QPen(QtGui.QColor(0, 0, 0), 3))  # Black outline
+    painter.setBrush(QtGui.QBrush(QtGui.QColor(255, 255, 255)))  # White fill
+    painter.drawPath(path)
+    
+    # Optional: Add inner shadow effect for depth
+    shadow_pen = QtGui.QPen(QtGui.QColor(200, 200, 200), 1)
+    painter.setPen(shadow_pen)
+    inner_rect = bubble_rect.adjusted(2, 2, -2, -2)
+    painter.drawRoundedRect(inner_rect, 13, 13)
+    painter.end()
+    return pix
+
+
+class _FrameLabel(QtWidgets.QLabel):
+    """
+    QLabel that can also show pre-scaled animation frames.
+
+    set_frame() only stores the pixmap and repaints the label, skipping the size-hint
+    and geometry bookkeeping QLabel.setPixmap() redoes for every frame. Frames are
+    drawn centred, like the label's own AlignCenter pixmaps.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._frame = None
+
+    def set_frame(self, pix):
+        """Show an animation frame, replacing any pixmap or movie content"""
+        if self._frame is None:
+            # Switching over from a pixmap or movie
+            super().clear()
+        self._frame = pix
+        self.update()
+
+    def setPixmap(self, pix):
+        self._frame = None
+        super().setPixmap(pix)
+
+    def setMovie(self, movie):
+        self._frame = None
+        super().setMovie(movie)
+
+    def clear(self):
+        self._frame = None
+        super().clear()
+
+    def paintEvent(self, event):
+        if self._frame is None:
+            return super().paintEvent(event)
+        rect = self.contentsRect()
+        size = self._frame.deviceIndependentSize()
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(
+            QtCore.QPointF(rect.x() + (rect.width() - size.width()) / 2, rect.y() + (rect.height() - size.height()) / 2),
+            self._frame,
+        )
+        painter.end()
+
+
+class _MangaBubble:
+    """Shared drawing and placement for the manga-style bubbles (mixed into a QWidget)"""
+    tail_height = 20
+
+    def paintEvent(self, event):
+        """Draw the manga-style speech bubble"""
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, _bubble_background(self.width(), self.height(), self.tail_height, self.devicePixelRatioF()))
+        painter.end()
+
+    def _move_above_parent(self):
+        """Place the bubble above the character, clamped to the screen"""
+        global_pos = self.parent_widget.mapToGlobal(self.parent_widget.rect().center())
+        x = global_pos.x() - self.width() // 2
+        y = global_pos.y() - self.parent_widget.height() // 2 - self.height() - 5
+        
+        # Clamp to screen bounds
+        screen_geom = self.parent_widget.screen_geometry()
+        x = max(screen_geom.left(), min(x, screen_geom.right() - self.width()))
+        y = max(screen_geom.top(), y)
+        
+        self.move(x, y)
+
+
+class QuestionBubble(_MangaBubble, QtWidgets.QDialog):
     """Interactive question input speech bubble"""
     def __init__(self, parent):
         super().__init__(parent)
@@ -94,7 +387,7 @@ class QuestionBubble(QtWidgets.QDialog):
         self.input_text = ""
         
         # Window setup
-        self.setWindowFlags(QtCore.Qt.FramelessWindowHint | QtCore.Qt.Tool | QtCore.Qt.WindowStaysOnTopHint)
+        self.setWindowFlags(_OVERLAY_WINDOW_FLAGS)
         self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
         
         # Dimensions
@@ -105,9 +398,6 @@ class QuestionBubble(QtWidgets.QDialog):
         horizontal_padding = 20
         vertical_padding = 15
         
-        # Tail properties
-        self.tail_height = 20
-        
         # Set widget size
         self.setFixedSize(bubble_width, bubble_height + self.tail_height)
         
@@ -118,88 +408,19 @@ class QuestionBubble(QtWidgets.QDialog):
         
         # Label
         self.label = QtWidgets.QLabel("Ask Chika:")
-        self.label.setStyleSheet("""
-            QLabel {
-                background: transparent;
-                color: #222;
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """)
+        self.label.setStyleSheet(_QUESTION_LABEL_QSS)
         layout.addWidget(self.label)
         
         # Input box
         self.input_box = QtWidgets.QLineEdit()
         self.input_box.setPlaceholderText("Type your question...")
-        self.input_box.setStyleSheet("""
-            QLineEdit {
-                background: white;
-                border: 2px solid #4a90e2;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 15px;
-                color: #222;
-            }
-            QLineEdit:focus {
-                border: 2px solid #357abd;
-            }
-        """)
+        self.input_box.setStyleSheet(_QUESTION_INPUT_QSS)
         self.input_box.returnPressed.connect(self._accept_if_valid)
         layout.addWidget(self.input_box)
         
-    def paintEvent(self, event):
-        """Draw the manga-style speech bubble"""
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-        
-        # Bubble dimensions
-        bubble_rect = QtCore.QRectF(0, 0, self.width(), self.height() - self.tail_height)
-        
-        # Create path for bubble with tail
-        path = QtGui.QPainterPath()
-        
-        # Main bubble (rounded rectangle)
-        path.addRoundedRect(bubble_rect, 15, 15)
-        
-        # Tail (pointing down to character)
-        tail_start_x = self.width() / 2 - 15
-        tail_tip_x = self.width() / 2
-        tail_end_x = self.width() / 2 + 15
-        tail_start_y = self.height() - self.tail_height
-        tail_tip_y = self.height()
-        
-        tail = QtGui.QPainterPath()
-        tail.moveTo(tail_start_x, tail_start_y)
-        tail.lineTo(tail_tip_x, tail_tip_y)
-        tail.lineTo(tail_end_x, tail_start_y)
-        tail.closeSubpath()
-        
-        path.addPath(tail)
-        
-        # Draw white fill with black outline (classic manga style)
-        painter.setPen(QtGui.QPen(QtGui.QColor(0, 0, 0), 3))  # Black outline
-        painter.setBrush(QtGui.QBrush(QtGui.QColor(255, 255, 255)))  # White fill
-        painter.drawPath(path)
-        
-        # Optional: Add inner shadow effect for depth
-        shadow_pen = QtGui.QPen(QtGui.QColor(200, 200, 200), 1)
-        painter.setPen(shadow_pen)
-        inner_rect = bubble_rect.adjusted(2, 2, -2, -2)
-        painter.drawRoundedRect(inner_rect, 13, 13)
-        
     def show_bubble(self):
         """Position and show the speech bubble above the character"""
-        # Position above the character
-        global_pos = self.parent_widget.mapToGlobal(self.parent_widget.rect().center())
-        x = global_pos.x() - self.width() // 2
-        y = global_pos.y() - self.parent_widget.height() // 2 - self.height() - 5
-        
-        # Clamp to screen bounds
-        screen_geom = QtWidgets.QApplication.primaryScreen().availableGeometry()
-        x = max(screen_geom.left(), min(x, screen_geom.right() - self.width()))
-        y = max(screen_geom.top(), y)
-        
-        self.move(x, y)
+        self._move_above_parent()
         self.show()
         
         # Set focus to input box
@@ -215,18 +436,55 @@ class QuestionBubble(QtWidgets.QDialog):
         """Return the input text"""
         return self.input_text
     
-class SpeechBubble(QtWidgets.QWidget):
+    def reset(self):
+        """Clear the previous question so the bubble can be shown again"""
+        self.input_text = ""
+        self.input_box.clear()
+    
+class SpeechBubble(_MangaBubble, QtWidgets.QWidget):
     """Custom manga-style speech bubble widget"""
+    # Padding values
+    HORIZONTAL_PADDING = 30
+    VERTICAL_PADDING = 20
+
     def __init__(self, parent, message, duration_ms=8000):
         super().__init__(parent)
         self.parent_widget = parent
-        self.message = message
-        self.duration_ms = duration_ms
         
         # Window setup
-        self.setWindowFlags(QtCore.Qt.FramelessWindowHint | QtCore.Qt.Tool | QtCore.Qt.WindowStaysOnTopHint)
+        self.setWindowFlags(_OVERLAY_WINDOW_FLAGS)
         self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
         
+        # Text label; its stylesheet is parsed once and reused for every message
+        self.text_label = QtWidgets.QLabel()
+        self.text_label.setWordWrap(True)
+        self.text_label.setAlignment(QtCore.Qt.AlignCenter)  # Center text
+        self.text_label.setStyleSheet(_CHAT_QSS)
+        # The font is fixed by the style sheet, so its metrics are built once per bubble
+        self.text_label.ensurePolished()
+        self._font_metrics = QtGui.QFontMetrics(self.text_label.font())
+        
+        # Layout for text - centered both horizontally and vertically
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(self.HORIZONTAL_PADDING, self.VERTICAL_PADDING,
+                                  self.HORIZONTAL_PADDING, self.VERTICAL_PADDING + self.tail_height)
+        layout.setAlignment(QtCore.Qt.AlignCenter)
+        layout.addWidget(self.text_label, alignment=QtCore.Qt.AlignCenter)
+        
+        # Single auto-close timer, restarted whenever a new message is shown
+        self._hide_timer = QtCore.QTimer(self)
+        self._hide_timer.setSingleShot(True)
+        self._hide_timer.timeout.connect(self.close)
+        
+        self.set_message(message, duration_ms)
+    
+    def set_message(self, message, duration_ms=8000):
+        """Replace the bubble text and resize the bubble to fit it"""
+        self.message = message
+        self.duration_ms = duration_ms
+        horizontal_padding = self.HORIZONTAL_PADDING
+        vertical_padding = self.VERTICAL_PADDING
+        
         # Calculate dimensions dynamically based on message length
         message_length = len(message)
         min_bubble_width = 200   
@@ -234,27 +492,13 @@ class SpeechBubble(QtWidgets.QWidget):
         BASE_WIDTH = 250
         max_bubble_width = int(BASE_WIDTH + (message_length * 1.75))  # Base width + 7 pixels per character
         max_bubble_height = int(max_bubble_width / RATIO)
-
-        # Padding values
-        horizontal_padding = 30
-        vertical_padding = 20
         
-        # Create text label to measure size
-        self.text_label = QtWidgets.QLabel(message)
-        self.text_label.setWordWrap(True)
-        self.text_label.setAlignment(QtCore.Qt.AlignCenter)  # Center text
-        self.text_label.setStyleSheet("""
-            QLabel {
-                background: transparent;
-                color: #222;
-                font-size: 15px;
-                font-weight: bold;
-                padding: 0px;
-            }
-        """)
+        self.text_label.setText(message)
+        # Undo any height cap left over from a previous long message
+        self.text_label.setMaximumHeight(16777215)  # QWIDGETSIZE_MAX
         
         # Calculate appropriate width based on text length
-        font_metrics = self.text_label.fontMetrics()
+        font_metrics = self._font_metrics
         text_width = font_metrics.horizontalAdvance(message)
         
         # Determine bubble width (adjustable based on message length)
@@ -268,12 +512,16 @@ class SpeechBubble(QtWidgets.QWidget):
             bubble_width = text_width + (horizontal_padding * 2)
             
         # Set label width for proper word wrap
-        self.text_label.setMaximumWidth(bubble_width - (horizontal_padding * 2))
-        self.text_label.setMinimumWidth(bubble_width - (horizontal_padding * 2))
-        self.text_label.adjustSize()
-        
-        # Calculate height based on wrapped text
-        text_height = self.text_label.sizeHint().height()
+        label_width = bubble_width - (horizontal_padding * 2)
+        self.text_label.setMaximumWidth(label_width)
+        self.text_label.setMinimumWidth(label_width)
+        
+        # Calculate height based on wrapped text, straight from the font metrics
+        text_height = font_metrics.boundingRect(
+            QtCore.QRect(0, 0, label_width, 16777215),
+            QtCore.Qt.TextWordWrap | QtCore.Qt.AlignCenter,
+            message
+        ).height()
         bubble_height = text_height + (vertical_padding * 2)
         
         # Cap at max height, but remove the cap if text is short
@@ -282,75 +530,17 @@ class SpeechBubble(QtWidgets.QWidget):
             # Enable scrolling for very long text by adjusting label
             self.text_label.setMaximumHeight(max_bubble_height - (vertical_padding * 2))
         
-        # Tail properties
-        self.tail_height = 20
-        
         # Set widget size
         self.setFixedSize(bubble_width, bubble_height + self.tail_height)
         
-        # Layout for text - centered both horizontally and vertically
-        layout = QtWidgets.QVBoxLayout(self)
-        layout.setContentsMargins(horizontal_padding, vertical_padding, horizontal_padding, vertical_padding + self.tail_height)
-        layout.setAlignment(QtCore.Qt.AlignCenter)
-        layout.addWidget(self.text_label, alignment=QtCore.Qt.AlignCenter)
-        
-    def paintEvent(self, event):
-        """Draw the manga-style speech bubble"""
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-        
-        # Bubble dimensions
-        bubble_rect = QtCore.QRectF(0, 0, self.width(), self.height() - self.tail_height)
-        
-        # Create path for bubble with tail
-        path = QtGui.QPainterPath()
-        
-        # Main bubble (rounded rectangle)
-        path.addRoundedRect(bubble_rect, 15, 15)
-        
-        # Tail (pointing down to character)
-        tail_start_x = self.width() / 2 - 15
-        tail_tip_x = self.width() / 2
-        tail_end_x = self.width() / 2 + 15
-        tail_start_y = self.height() - self.tail_height
-        tail_tip_y = self.height()
-        
-        tail = QtGui.QPainterPath()
-        tail.moveTo(tail_start_x, tail_start_y)
-        tail.lineTo(tail_tip_x, tail_tip_y)
-        tail.lineTo(tail_end_x, tail_start_y)
-        tail.closeSubpath()
-        
-        path.addPath(tail)
-        
-        # Draw white fill with black outline (classic manga style)
-        painter.setPen(QtGui.QPen(QtGui.QColor(0, 0, 0), 3))  # Black outline
-        painter.setBrush(QtGui.QBrush(QtGui.QColor(255, 255, 255)))  # White fill
-        painter.drawPath(path)
-        
-        # Optional: Add inner shadow effect for depth
-        shadow_pen = QtGui.QPen(QtGui.QColor(200, 200, 200), 1)
-        painter.setPen(shadow_pen)
-        inner_rect = bubble_rect.adjusted(2, 2, -2, -2)
-        painter.drawRoundedRect(inner_rect, 13, 13)
-        
     def show_bubble(self):
         """Position and show the speech bubble above the character"""
-        # Position above the character
-        global_pos = self.parent_widget.mapToGlobal(self.parent_widget.rect().center())
-        x = global_pos.x() - self.width() // 2
-        y = global_pos.y() - self.parent_widget.height() // 2 - self.height() - 5
-        
-        # Clamp to screen bounds
-        screen_geom = QtWidgets.QApplication.primaryScreen().availableGeometry()
-        x = max(screen_geom.left(), min(x, screen_geom.right() - self.width()))
-        y = max(screen_geom.top(), y)
-        
-        self.move(x, y)
+        # show() already schedules the paint; an extra update() would only queue a duplicate
+        self._move_above_parent()
         self.show()
         
-        # Auto-close after duration
-        QtCore.QTimer.singleShot(self.duration_ms, self.close)
+        # Auto-close after duration (restarting cancels the previous message's timer)
+        self._hide_timer.start(self.duration_ms)
 
 class ToolsDialog(QtWidgets.QDialog):
     """Dialog for selecting and executing tools from the tools folder"""
@@ -369,22 +559,36 @@ class ToolsDialog(QtWidgets.QDialog):
         
         # Title
         title = QtWidgets.QLabel("Select a tool to use:")
-        title.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px;")
+        title.setStyleSheet(_TOOLS_TITLE_QSS)
         layout.addWidget(title)
         
-        # Tab widget for different listener categories
-        tabs = QtWidgets.QTabWidget()
-        tabs.addTab(self.create_google_tools_tab(), "📧 Google")
-        tabs.addTab(self.create_microsoft_tools_tab(), "📅 Microsoft")
-        tabs.addTab(self.create_whatsapp_tools_tab(), "💬 WhatsApp")
-        tabs.addTab(self.create_other_tools_tab(), "🌐 Other")
-        layout.addWidget(tabs)
+        # Tab widget for different listener categories; each tab's widgets are built on first view
+        self.tabs = QtWidgets.QTabWidget()
+        self._tab_builders = {}
+        for builder, title in (
+            (self.create_google_tools_tab, "📧 Google"),
+            (self.create_microsoft_tools_tab, "📅 Microsoft"),
+            (self.create_whatsapp_tools_tab, "💬 WhatsApp"),
+            (self.create_other_tools_tab, "🌐 Other"),
+        ):
+            holder = QtWidgets.QWidget()
+            QtWidgets.QVBoxLayout(holder).setContentsMargins(0, 0, 0, 0)
+            self._tab_builders[self.tabs.addTab(holder, title)] = builder
+        self.tabs.currentChanged.connect(self._build_tab)
+        self._build_tab(self.tabs.currentIndex())
+        layout.addWidget(self.tabs)
         
         # Close button
         close_btn = QtWidgets.QPushButton("Close")
         close_btn.clicked.connect(self.accept)
         layout.addWidget(close_btn)
     
+    def _build_tab(self, index):
+        """Build a tab's contents the first time it is shown"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            self.tabs.widget(index).layout().addWidget(builder())
+    
     def create_google_tools_tab(self):
         """Create Google tools tab"""
         tab = QtWidgets.QWidget()
@@ -485,116 +689,345 @@ class ToolsDialog(QtWidgets.QDialog):
     
     def execute_tool(self, category, action):
         """Execute a tool based on category and action"""
-        self.parent_widget.show_chat_message(f"Executing {action}...", duration_ms=2000)
-        QtWidgets.QApplication.processEvents()
+        params = None
+        if category == "weather":
+            # Prompt for city
+            city, ok = QtWidgets.QInputDialog.getText(
+                self, "Weather Check", "Enter city name:"
+            )
+            if not (ok and city):
+                return
+            params = {"city": city, "days": 1, "formatted": True}
+        elif category == "search":
+            # Prompt for search query
+            query, ok = QtWidgets.QInputDialog.getText(
+                self, "Web Search", "Enter search query:"
+            )
+            if not (ok and query):
+                return
+            params = {"query": query, "max_results": 3, "formatted": True}
         
-        try:
-            from urllib.parse import urlencode
-            
-            base_url = "http://127.0.0.1:8576/tools"
-            
-            if category == "gmail":
+        # Announced only once the call is really made, not before a prompt that may be cancelled.
+        # The HTTP call runs on a ToolWorker; the result arrives as a speech bubble
+        self.parent_widget.show_chat_message(f"Executing {action}...", duration_ms=2000)
+        self.parent_widget.run_tool(category, action, params)
+
+# Keep-alive HTTP session shared by all worker threads (connection pool is thread-safe).
+# requests is imported on first use, off the GUI thread, so it does not delay the first paint.
+_MCP_SESSION = None
+_MCP_SESSION_LOCK = threading.Lock()
+
+
+def _mcp_session():
+    """Return the shared requests session, creating it on first use."""
+    global _MCP_SESSION
+    with _MCP_SESSION_LOCK:
+        if _MCP_SESSION is None:
+            import requests
+            _MCP_SESSION = requests.Session()
+        return _MCP_SESSION
+
+class ReplyCache:
+    """Reuses recent chat replies for repeated or near-duplicate prompts.
+
+    Exact repeats (ignoring case/whitespace) are a dict hit. Otherwise, when
+    sentence-transformers is installed, the prompt is embedded and the most
+    similar cached prompt is reused above SIMILARITY_THRESHOLD. Entries
+    expire after TTL_SECONDS because replies may include live tool data.
+    Thread-safe; lookups run on LLMWorker threads.
+    """
+    SIMILARITY_THRESHOLD = 0.92
+    TTL_SECONDS = 600
+    MAX_ENTRIES = 128
+
+    def __init__(self, embedding_model="all-MiniLM-L6-v2"):
+        self.embedding_model = embedding_model
+        self._lock = threading.Lock()
+        self._model_lock = threading.Lock()
+        # normalized prompt -> (expires_at, embedding or None, reply), oldest first
+        self._entries = {}
+        # Loaded on first use; False once loading has failed
+        self._model = None
+
+    @staticmethod
+    def _normalize(prompt):
+        return " ".join(prompt.lower().split())
+
+    def _embed(self, text):
+        """Return a unit-length embedding, or None when no model is available"""
+        with self._model_lock:
+            if self._model is None:
                 try:
-                    response = requests.get(f"http://127.0.0.1:8576/tools/gmail", timeout=15)
-                    if response.status_code == 200:
-                        data = response.json()
-                        emails = data.get('emails', [])
-                        result = f"📬 {len(emails)} new emails"
-                    else:
-                        result = f"Error: {response.status_code}"
+                    from sentence_transformers import SentenceTransformer
+                    self._model = SentenceTransformer(self.embedding_model)
                 except Exception as e:
-                    result = f"Error: {str(e)}"
-                
-            elif category == "outlook":
-                response = requests.get(f"{base_url}/outlook", timeout=50)
-                if response.status_code == 200:
-                    data = response.json()
-                    if action == "check_all":
-                        emails = data.get('emails', [])
-                        events = data.get('events', [])
-                        tasks = data.get('tasks', [])
-                        result = f"📧 {len(emails)} new emails, 📅 {len(events)} events, ✅ {len(tasks)} tasks"
-                    elif action == "check_emails":
-                        emails = data.get('emails', [])
-                        if emails:
-                            email_list = "\n".join([f"• {e.get('subject', 'No subject')}" for e in emails[:3]])
-                            result = f"📬 {len(emails)} new emails:\n{email_list}"
-                        else:
-                            result = "📭 No new emails"
-                    elif action == "check_events":
-                        events = data.get('events', [])
-                        if events:
-                            event_list = "\n".join([f"• {e.get('subject', 'No title')}" for e in events[:3]])
-                            result = f"📅 {len(events)} upcoming events:\n{event_list}"
-                        else:
-                            result = "📅 No upcoming events"
-                    elif action == "check_tasks":
-                        tasks = data.get('tasks', [])
-                        if tasks:
-                            task_list = "\n".join([f"• {t.get('title', 'No title')}" for t in tasks[:3]])
-                            result = f"✅ {len(tasks)} tasks:\n{task_list}"
-                        else:
-                            result = "✅ No pending tasks"
-                else:
-                    result = f"Error: {response.status_code}"
-                    
-            elif category == "whatsapp":
-                response = requests.get(f"{base_url}/whatsapp", timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    messages = data.get('messages', [])
-                    if messages:
-                        msg_list = "\n".join([f"• {m.get('senderName', 'Unknown')}: {m.get('text', '')[:30]}..." for m in messages[-3:]])
-                        result = f"💬 {len(messages)} messages:\n{msg_list}"
-                    else:
-                        result = "💬 No new messages"
-                else:
-                    result = f"Error: {response.status_code}"
-                    
-            elif category == "weather":
-                # Prompt for city
-                city, ok = QtWidgets.QInputDialog.getText(
-                    self, "Weather Check", "Enter city name:"
-                )
-                if ok and city:
-                    params = urlencode({"city": city, "days": 1, "formatted": True})
-                    response = requests.get(f"{base_url}/weather?{params}", timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
-                        result = data.get('text', 'No data')
-                    else:
-                        result = f"Error: {response.status_code}"
-                else:
-                    return
-                    
-            elif category == "search":
-                # Prompt for search query
-                query, ok = QtWidgets.QInputDialog.getText(
-                    self, "Web Search", "Enter search query:"
-                )
-                if ok and query:
-                    params = urlencode({"query": query, "max_results": 3, "formatted": True})
-                    response = requests.get(f"{base_url}/search?{params}", timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
-                        result = data.get('text', 'No results')
-                    else:
-                        result = f"Error: {response.status_code}"
-                else:
-                    return
-            else:
-                result = "Unknown tool category"
-            
-            self.parent_widget.show_chat_message(result)
-            
+                    print(f"Semantic reply cache disabled: {e}")
+                    self._model = False
+        if self._model is False:
+            return None
+        return self._model.encode(text, normalize_embeddings=True, convert_to_numpy=True)
+
+    def _live_entries(self):
+        """Drop expired entries and return the remaining ones (caller holds the lock)"""
+        now = time.monotonic()
+        for key in [k for k, (expires, _, _) in self._entries.items() if expires <= now]:
+            del self._entries[key]
+        return self._entries
+
+    def lookup(self, prompt):
+        """Return a cached reply for prompt, or None"""
+        key = self._normalize(prompt)
+        with self._lock:
+            entries = self._live_entries()
+            hit = entries.get(key)
+            if hit:
+                return hit[2]
+            candidates = [(emb, reply) for _, emb, reply in entries.values() if emb is not None]
+        if not candidates:
+            return None
+        emb = self._embed(key)
+        if emb is None:
+            return None
+        import numpy as np
+        sims = np.stack([c[0] for c in candidates]) @ emb
+        best = int(sims.argmax())
+        return candidates[best][1] if sims[best] > self.SIMILARITY_THRESHOLD else None
+
+    def store(self, prompt, reply):
+        """Remember reply for prompt"""
+        key = self._normalize(prompt)
+        emb = self._embed(key)
+        with self._lock:
+            entries = self._live_entries()
+            entries.pop(key, None)
+            if len(entries) >= self.MAX_ENTRIES:
+                entries.pop(next(iter(entries)))
+            entries[key] = (time.monotonic() + self.TTL_SECONDS, emb, reply)
+
+# Shared by every LLMWorker
+REPLY_CACHE = ReplyCache(CONFIG.get("rag", {}).get("embedding_model", "all-MiniLM-L6-v2"))
+
+class LLMWorker(QThread):
+    """Sends a prompt to the MCP server's /gemini_chat endpoint off the GUI thread"""
+    result = Signal(str)
+    partial = Signal(str)  # progress messages so far, emitted as the server streams them
+
+    def __init__(self, prompt, system_prompt=None, parent=None):
+        super().__init__(parent)
+        self.prompt = prompt
+        self.system_prompt = system_prompt
+
+    def run(self):
+        reply = REPLY_CACHE.lookup(self.prompt)
+        if reply is not None:
+            self.result.emit(reply)
+            return
+        reply, ok, tool_trace = self._fetch_reply()
+        self.result.emit(reply)
+        # Tool-backed replies (mail, weather, messages...) are live data and must not be reused.
+        # Store after emitting: the first store may load the embedding model
+        if ok and not tool_trace:
+            REPLY_CACHE.store(self.prompt, reply)
+
+    def _fetch_reply(self):
+        """Return (reply text, ok, tool_trace): progress messages + final answer, or an error string.
+
+        tool_trace is the server's list of tool calls made for the reply (empty if none).
+        """
+        try:
+            mcp_url = "http://127.0.0.1:8576/gemini_chat"
+            payload = {
+                "prompt": self.prompt,
+                "system_prompt": self.system_prompt,
+                "stream": True
+            }
+            response = _mcp_session().post(mcp_url, json=payload, timeout=30, stream=True)
+            if response.status_code == 200:
+                body, progress_messages = self._read_stream(response)
+                if body is None:
+                    return "Error: MCP server closed the reply stream early", False, []
+                final_reply = body.get("reply", "(No reply)")
+                tool_trace = body.get("tool_trace") or []
+                session_incomplete = body.get("session_incomplete", False)
+
+                deduped_messages = []
+                for msg in progress_messages:
+                    cleaned = (msg or "").strip()
+                    if not cleaned:
+                        continue
+                    if not deduped_messages or deduped_messages[-1] != cleaned:
+                        deduped_messages.append(cleaned)
+
+                cleaned_final = (final_reply or "").strip() or "(No reply)"
+                progress_only = [msg for msg in deduped_messages if msg != cleaned_final]
+                reply = "\n\n".join(progress_only + [cleaned_final])
+
+                if session_incomplete:
+                    reply = f"{reply}\n\n[Warning] Session ended without explicit stop_session signal."
+                    return reply, False, tool_trace
+                return reply, True, tool_trace
+            return f"Error: MCP server returned status {response.status_code}\n{response.text}", False, []
+        except Exception as e:
+            return f"Error contacting MCP server: {e}", False, []
+
+    def _read_stream(self, response):
+        """Consume the NDJSON reply, emitting partial for each new progress message.
+
+        Returns:
+            (final payload or None if the stream ended early, list of progress messages)
+        """
+        progress_messages = []
+        with response:
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                event = _json_loads(line)
+                if event.get("type") == "final":
+                    return event, progress_messages
+                text = (event.get("text") or "").strip()
+                if text and (not progress_messages or progress_messages[-1] != text):
+                    progress_messages.append(text)
+                    self.partial.emit("\n\n".join(progress_messages))
+        return None, progress_messages
+
+# Outlook parts each tools-dialog action needs from /tools/outlook
+_OUTLOOK_INCLUDE = {
+    "check_emails": "emails",
+    "check_events": "events",
+    "check_tasks": "tasks",
+}
+
+# Recently fetched Outlook parts, so back-to-back tool clicks skip the Graph round-trip
+OUTLOOK_CACHE_TTL_S = 5.0
+_OUTLOOK_CACHE = {}  # part -> (fetched_at, items)
+_OUTLOOK_CACHE_LOCK = threading.Lock()
+
+
+def _fetch_outlook(base_url, include):
+    """Return {part: items} for the comma-separated Outlook parts, reusing fresh cache entries.
+
+    Args:
+        base_url: Tools API base URL
+        include: Comma-separated parts (emails, events, tasks)
+
+    Returns:
+        Tuple of (data dict, None) on success or (None, HTTP status code) on failure
+    """
+    parts = include.split(",")
+    now = time.monotonic()
+    data = {}
+    with _OUTLOOK_CACHE_LOCK:
+        for part in parts:
+            entry = _OUTLOOK_CACHE.get(part)
+            if entry and now - entry[0] < OUTLOOK_CACHE_TTL_S:
+                data[part] = entry[1]
+    missing = [part for part in parts if part not in data]
+    if not missing:
+        return data, None
+
+    response = _mcp_session().get(f"{base_url}/outlook", params={"include": ",".join(missing)}, timeout=50)
+    if response.status_code != 200:
+        return None, response.status_code
+    fetched = response.json()
+    fetched_at = time.monotonic()
+    with _OUTLOOK_CACHE_LOCK:
+        for part in missing:
+            items = fetched.get(part, [])
+            _OUTLOOK_CACHE[part] = (fetched_at, items)
+            data[part] = items
+    return data, None
+
+class ToolWorker(QThread):
+    """Calls a tools API endpoint off the GUI thread and formats the result for a speech bubble"""
+    result = Signal(str, int)  # message, duration_ms (0 = sized to the message)
+
+    BASE_URL = "http://127.0.0.1:8576/tools"
+
+    def __init__(self, category, action, params=None, parent=None):
+        super().__init__(parent)
+        self.category = category
+        self.action = action
+        self.params = params
+
+    def run(self):
+        import requests
+        try:
+            self.result.emit(self._fetch_result(), 0)
         except requests.exceptions.ConnectionError:
-            self.parent_widget.show_chat_message(
-                "⚠️ Cannot connect to tools API. Please make sure tools_app.py is running.",
-                duration_ms=5000
+            self.result.emit(
+                "⚠️ Cannot connect to tools API. Please make sure tools_app.py is running.", 5000
             )
         except Exception as e:
-            self.parent_widget.show_chat_message(f"Error: {str(e)}", duration_ms=5000)
             print(f"Tool execution error: {e}")
+            self.result.emit(f"Error: {str(e)}", 5000)
+
+    def _fetch_result(self):
+        """Return the message to show for this tool call"""
+        category, action, base_url = self.category, self.action, self.BASE_URL
+
+        if category == "gmail":
+            try:
+                # Only the count is shown, so one short preview is enough to get total_count back
+                response = _mcp_session().get(
+                    f"{base_url}/gmail", params={"page_size": 1, "body_max_chars": 200}, timeout=15
+                )
+                if response.status_code == 200:
+                    data = response.json()
+                    emails = data.get('emails', [])
+                    total = data.get('total_count', len(emails))
+                    return f"📬 {total} new emails"
+                return f"Error: {response.status_code}"
+            except Exception as e:
+                return f"Error: {str(e)}"
+
+        if category == "outlook":
+            # Only fetch what the action shows; the endpoint fans out the rest concurrently
+            include = _OUTLOOK_INCLUDE.get(action, "emails,events,tasks")
+            data, status = _fetch_outlook(base_url, include)
+            if data is None:
+                return f"Error: {status}"
+            if action == "check_all":
+                emails = data.get('emails', [])
+                events = data.get('events', [])
+                tasks = data.get('tasks', [])
+                return f"📧 {len(emails)} new emails, 📅 {len(events)} events, ✅ {len(tasks)} tasks"
+            if action == "check_emails":
+                emails = data.get('emails', [])
+                if emails:
+                    email_list = "\n".join([f"• {e.get('subject', 'No subject')}" for e in emails[:3]])
+                    return f"📬 {len(emails)} new emails:\n{email_list}"
+                return "📭 No new emails"
+            if action == "check_events":
+                events = data.get('events', [])
+                if events:
+                    event_list = "\n".join([f"• {e.get('subject', 'No title')}" for e in events[:3]])
+                    return f"📅 {len(events)} upcoming events:\n{event_list}"
+                return "📅 No upcoming events"
+            if action == "check_tasks":
+                tasks = data.get('tasks', [])
+                if tasks:
+                    task_list = "\n".join([f"• {t.get('title', 'No title')}" for t in tasks[:3]])
+                    return f"✅ {len(tasks)} tasks:\n{task_list}"
+                return "✅ No pending tasks"
+            return "Unknown tool action"
+
+        if category == "whatsapp":
+            response = _mcp_session().get(f"{base_url}/whatsapp", timeout=10)
+            if response.status_code != 200:
+                return f"Error: {response.status_code}"
+            messages = response.json().get('messages', [])
+            if messages:
+                msg_list = "\n".join([f"• {m.get('senderName', 'Unknown')}: {m.get('text', '')[:30]}..." for m in messages[-3:]])
+                return f"💬 {len(messages)} messages:\n{msg_list}"
+            return "💬 No new messages"
+
+        if category in ("weather", "search"):
+            response = _mcp_session().get(f"{base_url}/{category}", params=self.params, timeout=10)
+            if response.status_code != 200:
+                return f"Error: {response.status_code}"
+            return response.json().get('text', 'No data' if category == "weather" else 'No results')
+
+        return "Unknown tool category"
 
 class FloatingCharacter(QtWidgets.QWidget):
     def show_chat_message(self, message, duration_ms=None):
@@ -608,19 +1041,33 @@ class FloatingCharacter(QtWidgets.QWidget):
             calculated_duration = 3000 + (char_count * 50)
             duration_ms = max(2000, min(calculated_duration, 20000))
         
-        dialog = SpeechBubble(self, message, duration_ms)
-        dialog.show_bubble()
+        # One bubble is reused for every message; a new message replaces the current one
+        if self._chat_bubble is None:
+            self._chat_bubble = SpeechBubble(self, message, duration_ms)
+            self._chat_bubble.show_bubble()
+            return
+        bubble = self._chat_bubble
+        # Batch the text change, resize and move of a visible bubble into a single repaint
+        bubble.setUpdatesEnabled(False)
+        try:
+            bubble.set_message(message, duration_ms)
+            bubble.show_bubble()
+        finally:
+            bubble.setUpdatesEnabled(True)
 
     def show_question_dialog(self):
         """Show question input in a manga-style speech bubble"""
-        dialog = QuestionBubble(self)
+        if self._question_bubble is None:
+            self._question_bubble = QuestionBubble(self)
+        dialog = self._question_bubble
+        dialog.reset()
         dialog.show_bubble()
         result = dialog.exec()
         return dialog.get_input() if result == QtWidgets.QDialog.Accepted else None
 
     def __init__(self):
         super().__init__()
-        self.setWindowFlags(QtCore.Qt.FramelessWindowHint | QtCore.Qt.WindowStaysOnTopHint | QtCore.Qt.Tool)
+        self.setWindowFlags(_OVERLAY_WINDOW_FLAGS)
         self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
         self.setWindowOpacity(WINDOW_OPACITY)
 
@@ -629,26 +1076,129 @@ class FloatingCharacter(QtWidgets.QWidget):
         self.dragging = False
         self.move_mode = False
         self.last_mouse_pos = None
+        # Detects the end of a window-manager drag, which may not deliver a release event
+        self._system_move_timer = QtCore.QTimer(self, interval=SYSTEM_MOVE_SETTLE_MS)
+        self._system_move_timer.setSingleShot(True)
+        self._system_move_timer.timeout.connect(self._on_system_move_settled)
+        self._system_move_idle_checks = 0
+        # Fallback drag: cursor moves inside one frame are coalesced into a single move()
+        self._pending_drag_pos = None
+        self._last_drag_move_ns = 0
+        self._drag_flush_timer = QtCore.QTimer(self, interval=DRAG_MOVE_INTERVAL_MS)
+        self._drag_flush_timer.setSingleShot(True)
+        self._drag_flush_timer.timeout.connect(self._apply_drag)
         self.vx = 0
         self.vy = 0
         self.menu_visible = False
         self.menu_buttons = []
+        # Running LLMWorker threads (kept referenced until they finish)
+        self._workers = []
+        # Speech/question bubbles, created on first use and reused afterwards
+        self._chat_bubble = None
+        self._question_bubble = None
+        self._tools_dialog = None
+
+        # Work area of the character's screen, refreshed only when screens change
+        self._screen_geom = None
+        self._watched_screen = None
+        self._window_screen_hooked = False
+        self._refresh_screen_geometry()
+        app = QtGui.QGuiApplication.instance()
+        app.primaryScreenChanged.connect(self._refresh_screen_geometry)
+        # Unplugging the watched monitor moves the character elsewhere
+        app.screenRemoved.connect(self._refresh_screen_geometry)
 
         self._build_ui()
 
-        self.wander_timer = QtCore.QTimer(self, interval=WANDER_INTERVAL_MS)
+        self._wander_table = self._build_wander_table()
+        self._wander_index = 0
+        # Glide between wander waypoints instead of jumping there in one move()
+        self._wander_anim = QtCore.QPropertyAnimation(self, b"pos", self)
+        self._wander_anim.setDuration(WANDER_ANIMATION_MS)
+        self._wander_anim.setEasingCurve(QtCore.QEasingCurve.InOutSine)
+        self.wander_timer = QtCore.QTimer(self, interval=self._wander_interval())
         self.wander_timer.timeout.connect(self._wander_step)
         self.wander_timer.start()
+        # Pause wandering while the user is away; only where the OS reports input idle time
+        self._user_idle = False
+        self._idle_timer = QtCore.QTimer(self, interval=IDLE_CHECK_MS)
+        self._idle_timer.timeout.connect(self._check_idle)
+        if system_idle_seconds() is not None:
+            self._idle_timer.start()
+
+        # Build the tray icon after the first paint so the character shows up sooner
+        QtCore.QTimer.singleShot(0, self._create_tray)
+
+        self.move(self._screen_geom.center() - self.rect().center())
+
+    def _refresh_screen_geometry(self, *_):
+        """Re-read the available geometry of the character's screen and track its changes"""
+        # Before the native window exists this is the primary screen
+        screen = self.screen() or QtWidgets.QApplication.primaryScreen()
+        if screen is not self._watched_screen:
+            if self._watched_screen is not None:
+                try:
+                    self._watched_screen.availableGeometryChanged.disconnect(self._refresh_screen_geometry)
+                except (RuntimeError, TypeError):
+                    pass
+            screen.availableGeometryChanged.connect(self._refresh_screen_geometry)
+            self._watched_screen = screen
+            if hasattr(self, 'wander_timer'):
+                self.wander_timer.setInterval(self._wander_interval())
+        self._screen_geom = screen.availableGeometry()
+        self._update_wander_bounds()
+
+    def _wander_interval(self):
+        """Wander tick in ms, floored at one frame of the watched screen"""
+        # A configured interval shorter than one display frame could never be seen
+        refresh_rate = self._watched_screen.refreshRate() or 60.0
+        return max(WANDER_INTERVAL_MS, math.ceil(1000 / refresh_rate))
+
+    def _update_wander_bounds(self):
+        """Precompute the (min_x, max_x, min_y, max_y) clamp range for _wander_step"""
+        geom = getattr(self, '_screen_geom', None)
+        if geom is None:
+            return
+        self._wander_bounds = (
+            geom.left(), geom.right() - self.width(),
+            geom.top(), geom.bottom() - self.height(),
+        )
 
-        self._create_tray()
-
-        screen = QtWidgets.QApplication.primaryScreen().availableGeometry()
-        self.move(screen.center() - self.rect().center())
-
-    def _create_tray(self):
-        self.tray = QtWidgets.QSystemTrayIcon(self)
-        icon = QtGui.QIcon.fromTheme("applications-games")
-        if icon.isNull():
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        # Size mode can change the window size, which moves the clamp range
+        self._update_wander_bounds()
+        return super().resizeEvent(event)
+
+    def screen_geometry(self):
+        """Cached available geometry of the screen the character is on"""
+        return self._screen_geom
+
+    @staticmethod
+    def _placeholder_pixmap(width, height):
+        """Drawn stand-in character used when no GIF is available (rendered once per size)"""
+        key = f"placeholder|{width}x{height}"
+        pix = QtGui.QPixmapCache.find(key)
+        if pix is not None and not pix.isNull():
+            return pix
+        pix = QtGui.QPixmap(width, height)
+        pix.fill(QtCore.Qt.transparent)
+        p = QtGui.QPainter(pix)
+        p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        p.setBrush(QtGui.QBrush(QtGui.QColor(255, 200, 0)))
+        p.setPen(QtGui.QPen(QtGui.QColor(150, 70, 0)))
+        d = min(width, height) - 20
+        d = max(d, 20)
+        p.drawEllipse(10, 10, d, d)
+        p.end()
+        QtGui.QPixmapCache.insert(key, pix)
+        return pix
+
+    @staticmethod
+    def _fallback_tray_icon():
+        """Blue dot tray icon for themes without 'applications-games' (rendered once)"""
+        key = "tray_fallback|64"
+        pix = QtGui.QPixmapCache.find(key)
+        if pix is None or pix.isNull():
             pix = QtGui.QPixmap(64, 64)
             pix.fill(QtCore.Qt.transparent)
             p = QtGui.QPainter(pix)
@@ -656,7 +1206,14 @@ class FloatingCharacter(QtWidgets.QWidget):
             p.setBrush(QtGui.QBrush(QtGui.QColor(30, 144, 255)))
             p.drawEllipse(0, 0, 64, 64)
             p.end()
-            icon = QtGui.QIcon(pix)
+            QtGui.QPixmapCache.insert(key, pix)
+        return QtGui.QIcon(pix)
+
+    def _create_tray(self):
+        self.tray = QtWidgets.QSystemTrayIcon(self)
+        icon = QtGui.QIcon.fromTheme("applications-games")
+        if icon.isNull():
+            icon = self._fallback_tray_icon()
         self.tray.setIcon(icon)
 
         menu = QtWidgets.QMenu()
@@ -688,34 +1245,46 @@ class FloatingCharacter(QtWidgets.QWidget):
         self._temp_gif_playing = True
         self.wander_timer.stop()
 
-        temp_movie = QtGui.QMovie(temp_gif_path)
-        if not temp_movie.isValid():
-            print(f"Invalid temp GIF: {temp_gif_path}")
-            self._temp_gif_playing = False
-            self.wander_timer.start()
-            return
+        # Pre-scaled frames are decoded once per GIF and size and reused on every swap
+        if not self._show_char_frames(self.char_label.size(), temp_gif_path):
+            temp_movie = QtGui.QMovie(temp_gif_path)
+            if not temp_movie.isValid():
+                print(f"Invalid temp GIF: {temp_gif_path}")
+                self._temp_gif_playing = False
+                self._resume_wander()
+                return
 
-        temp_movie.setCacheMode(QtGui.QMovie.CacheAll)
-        temp_movie.setSpeed(100)
-        temp_movie.setScaledSize(self.char_label.size())
-        self.char_label.setMovie(temp_movie)
-        self.movie = temp_movie
-        temp_movie.start()
+            self._frame_timer.stop()
+            # QMovie frames have their own silhouettes
+            self.clearMask()
+            temp_movie.setCacheMode(QtGui.QMovie.CacheAll)
+            temp_movie.setSpeed(100)
+            temp_movie.setScaledSize(self.char_label.size())
+            self.char_label.setMovie(temp_movie)
+            self.movie = temp_movie
+            temp_movie.start()
 
         def _switch_to_idle():
             if not Path(RETURN_GIF).exists():
                 print(f"Idle GIF not found: {RETURN_GIF}")
                 self._temp_gif_playing = False
-                self.wander_timer.start()
+                self._resume_wander()
+                return
+
+            if self._show_char_frames(self.char_label.size(), RETURN_GIF):
+                self._temp_gif_playing = False
+                self._resume_wander()
                 return
 
             idle_movie = QtGui.QMovie(RETURN_GIF)
             if not idle_movie.isValid():
                 print(f"Invalid idle GIF: {RETURN_GIF}")
                 self._temp_gif_playing = False
-                self.wander_timer.start()
+                self._resume_wander()
                 return
 
+            self._frame_timer.stop()
+            self.clearMask()
             idle_movie.setCacheMode(QtGui.QMovie.CacheAll)
             idle_movie.setSpeed(100)
             idle_movie.setScaledSize(self.char_label.size())
@@ -725,14 +1294,32 @@ class FloatingCharacter(QtWidgets.QWidget):
             idle_movie.start()
 
             self._temp_gif_playing = False
-            self.wander_timer.start()
+            self._resume_wander()
 
         QtCore.QTimer.singleShot(duration_ms, _switch_to_idle)
+    def _resume_wander(self):
+        """Restart the wander timer unless the window is hidden or the user is idle"""
+        if self.isVisible() and not self._user_idle:
+            self.wander_timer.start()
+
+    def _check_idle(self):
+        idle = system_idle_seconds()
+        if idle is None:
+            return
+        if idle > USER_IDLE_SECONDS:
+            if not self._user_idle:
+                self._user_idle = True
+                self.wander_timer.stop()
+        elif self._user_idle:
+            self._user_idle = False
+            if not getattr(self, '_temp_gif_playing', False):
+                self._resume_wander()
+
     def _toggle_visibility(self):
         self.setVisible(not self.isVisible())
 
     def _on_tray_activated(self, reason):
-        if reason == QtWidgets.QSystemTrayIcon.ActivationReason.Trigger:
+        if reason == _TRAY_TRIGGER:
             self._toggle_visibility()
 
     def _restart_movie(self):
@@ -744,12 +1331,22 @@ class FloatingCharacter(QtWidgets.QWidget):
         layout.setContentsMargins(8, 8, 8, 8)
         layout.setSpacing(6)
 
-        self.char_label = QtWidgets.QLabel()
+        self.char_label = _FrameLabel()
         self.char_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.char_label, alignment=QtCore.Qt.AlignHCenter)
 
         self.movie = None
         self._applied_first_frame = False
+        # Pre-scaled frames of the character GIF, played by _frame_timer instead of QMovie
+        self._char_frames = []
+        self._char_frames_size = None
+        self._frames_path = CHARACTER_GIF
+        # (path, size, label rect) -> silhouette QRegion for setMask
+        self._mask_cache = {}
+        self._char_frame_index = 0
+        self._frame_timer = QtCore.QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.timeout.connect(self._advance_char_frame)
         print(f"Character GIF path: {CHARACTER_GIF}")
         if CHARACTER_GIF and Path(CHARACTER_GIF).exists():
             print("GIF file exists.")
@@ -757,6 +1354,12 @@ class FloatingCharacter(QtWidgets.QWidget):
                 self.movie = QtGui.QMovie(CHARACTER_GIF)
                 if self.movie.isValid():
                     print("QMovie loaded GIF successfully.")
+                    # The movie only supplies frame metadata; _apply_size_mode decodes
+                    # pre-scaled frames and starts _frame_timer
+                    self.movie.jumpToFrame(0)
+                    self._apply_size_mode()
+                if self.movie.isValid() and not self._char_frames:
+                    # Fall back to QMovie playback if the frames could not be pre-decoded
                     # Defer scaled size to _apply_size_mode once we know frame size
                     self.movie.setCacheMode(QtGui.QMovie.CacheAll)
                     self.movie.setSpeed(100)
@@ -771,7 +1374,7 @@ class FloatingCharacter(QtWidgets.QWidget):
                     # Also re-apply after a short delay to catch metadata readiness
                     QtCore.QTimer.singleShot(250, self._apply_size_mode)
                     self.movie.start()
-                else:
+                elif not self.movie.isValid():
                     print("QMovie failed to load GIF: invalid format or corrupted file.")
             except Exception as e:
                 print(f"Exception loading GIF: {e}")
@@ -788,28 +1391,38 @@ class FloatingCharacter(QtWidgets.QWidget):
                 pad_w = margins.left() + margins.right()
                 pad_h = margins.top() + margins.bottom()
                 label_size = QtCore.QSize(max(CONFIG_WINDOW_W - pad_w, 50), max(CONFIG_WINDOW_H - pad_h, 50))
-            pix = QtGui.QPixmap(label_size)
-            pix.fill(QtCore.Qt.transparent)
-            p = QtGui.QPainter(pix)
-            p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-            p.setBrush(QtGui.QBrush(QtGui.QColor(255, 200, 0)))
-            p.setPen(QtGui.QPen(QtGui.QColor(150, 70, 0)))
-            d = min(label_size.width(), label_size.height()) - 20
-            d = max(d, 20)
-            p.drawEllipse(10, 10, d, d)
-            p.end()
-            self.char_label.setPixmap(pix)
+            self.char_label.setPixmap(self._placeholder_pixmap(label_size.width(), label_size.height()))
 
         self.setLayout(layout)
 
     def showEvent(self, event: QtGui.QShowEvent) -> None:
+        # The native window exists from the first show; follow it across monitors
+        if not self._window_screen_hooked and self.windowHandle() is not None:
+            self.windowHandle().screenChanged.connect(self._refresh_screen_geometry)
+            self._window_screen_hooked = True
+            self._refresh_screen_geometry()
         # Re-apply size mode after the widget is shown to ensure final geometry
         try:
             self._apply_size_mode()
         except Exception as e:
             print(f"showEvent sizing error: {e}")
+        # Timers are stopped while hidden so the GUI thread is not woken for nothing
+        if not getattr(self, '_temp_gif_playing', False):
+            if not self._user_idle:
+                self.wander_timer.start()
+            if self._char_frames and self.char_label.movie() is None and not self._frame_timer.isActive():
+                self._frame_timer.start(self._char_frames[self._char_frame_index][1])
+        # Label geometry is only final once the layout has run for the shown window
+        self._update_char_mask()
         return super().showEvent(event)
 
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:
+        self.wander_timer.stop()
+        self._frame_timer.stop()
+        if self._wander_anim.state() == QtCore.QAbstractAnimation.Running:
+            self._wander_anim.stop()
+        return super().hideEvent(event)
+
     def _on_first_frame(self, _index: int):
         if not self._applied_first_frame:
             self._apply_size_mode()
@@ -858,11 +1471,84 @@ class FloatingCharacter(QtWidgets.QWidget):
         try:
             self.setFixedSize(win_w, win_h)
             self.char_label.setFixedSize(label_w, label_h)
-            if self.movie and self.movie.isValid():
-                self.movie.setScaledSize(QtCore.QSize(label_w, label_h))
+            label_size = QtCore.QSize(label_w, label_h)
+            label_movie = self.char_label.movie()
+            if label_movie is not None:
+                label_movie.setScaledSize(label_size)
+            elif self.movie and self.movie.isValid() and self._char_frames_size != label_size:
+                self._show_char_frames(label_size)
         except Exception as e:
             print(f"Error applying size mode: {e}")
 
+    def _show_char_frames(self, size: QtCore.QSize, path: str = None) -> bool:
+        """
+        Decode a GIF at the label size and start cycling its pre-scaled frames.
+
+        Args:
+            size: Label size to fit the frames into.
+            path: GIF to play; defaults to the one currently shown (initially CHARACTER_GIF).
+
+        Returns:
+            True if frames are playing, False (current frames kept) if the GIF could not be decoded.
+        """
+        path = path or self._frames_path
+        frames = load_scaled_frames(path, size)
+        self._char_frames_size = size
+        if not frames:
+            return False
+        if path != self._frames_path:
+            self._frames_path = path
+            self._char_frame_index = 0
+        self._frame_timer.stop()
+        self._char_frames = frames
+        self._char_frame_index %= len(frames)
+        pix, delay = frames[self._char_frame_index]
+        # Also leaves a QMovie fallback or the placeholder pixmap
+        self.char_label.set_frame(pix)
+        if len(frames) > 1:
+            self._frame_timer.start(delay)
+        self._update_char_mask()
+        return True
+
+    def _update_char_mask(self):
+        """
+        Clip the window to the character's silhouette.
+
+        The mask is the union of every pre-scaled frame's alpha mask, computed once per
+        GIF and size, so pixels outside the character are neither composited nor hit-tested.
+        """
+        if not self._char_frames or self.char_label.movie() is not None:
+            return
+        layout = self.layout()
+        if layout is not None:
+            layout.activate()
+        label_rect = self.char_label.geometry()
+        size = self._char_frames_size
+        key = (self._frames_path, size.width(), size.height(), label_rect.getRect())
+        region = self._mask_cache.get(key)
+        if region is None:
+            region = QtGui.QRegion()
+            for pix, _ in self._char_frames:
+                # The label centres the pixmap, which may be smaller than the label
+                offset = QtCore.QPoint(
+                    label_rect.x() + (label_rect.width() - pix.width()) // 2,
+                    label_rect.y() + (label_rect.height() - pix.height()) // 2,
+                )
+                bitmap = pix.mask()
+                frame_region = QtGui.QRegion(bitmap) if not bitmap.isNull() else QtGui.QRegion(pix.rect())
+                region = region.united(frame_region.translated(offset))
+            self._mask_cache[key] = region
+        if not region.isEmpty():
+            self.setMask(region)
+
+    def _advance_char_frame(self):
+        if not self._char_frames:
+            return
+        self._char_frame_index = (self._char_frame_index + 1) % len(self._char_frames)
+        pix, delay = self._char_frames[self._char_frame_index]
+        self.char_label.set_frame(pix)
+        self._frame_timer.start(delay)
+
     def _gif_intrinsic_size(self):
         """Try multiple ways to determine the GIF's intrinsic frame size."""
         try:
@@ -910,60 +1596,60 @@ class FloatingCharacter(QtWidgets.QWidget):
         # Get the center position of the character window in global coordinates
         global_center = self.mapToGlobal(self.rect().center())
         center_x, center_y = global_center.x(), global_center.y()
-        radius = 110  # Closer distance to keep buttons over the GIF
         
-        # Define buttons at 10, 11, and 12 o'clock: (angle_degrees, label, icon_text, callback)
-        # Angles: 240° (10 o'clock), 270° (12 o'clock), 300° (11 o'clock)
-        buttons_config = [
-            (360, "Prompt", "💬", self._on_prompt_click),      
-            (310, "Move", "✋", self._on_move_click),      
-            (260, "Close", "❌", self._on_quick_close_click),
-            (210, "Tools", "🔧", self._on_tools_click)         
-        ]
+        # The four buttons are built on the first open and only moved and re-shown afterwards
+        if not self.menu_buttons:
+            self._build_menu_buttons()
         
-        for angle, label, icon, callback in buttons_config:
-            # Create as a top-level widget
-            btn = QtWidgets.QPushButton(icon)
-            btn.setWindowFlags(QtCore.Qt.FramelessWindowHint | QtCore.Qt.WindowStaysOnTopHint | QtCore.Qt.Tool)
+        for btn, (dx, dy) in zip(self.menu_buttons, _MENU_OFFSETS):
+            btn.move(center_x + dx, center_y + dy)
+            btn.show()
+            # A re-shown window may keep its old stacking position below the character
+            btn.raise_()
+
+    def _build_menu_buttons(self):
+        """Create the circular menu buttons as hidden tool windows owned by the character"""
+        dpr = self.devicePixelRatioF()
+        for _, label, glyph, handler in _MENU_BUTTONS:
+            # Owned by the character so the pooled buttons die with it and stack above it
+            btn = QtWidgets.QPushButton(self)
+            btn.setWindowFlags(_OVERLAY_WINDOW_FLAGS)
             btn.setAttribute(QtCore.Qt.WA_TranslucentBackground)
-            btn.setFixedSize(60, 60)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #4a90e2, stop:1 #357abd);
-                    border: 3px solid white;
-                    border-radius: 30px;
-                    color: white;
-                    font-size: 24px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #5ba3ff, stop:1 #4a90e2);
-                    border: 3px solid #ffe082;
-                }
-                QPushButton:pressed {
-                    background: #2d5f8d;
-                }
-            """)
+            btn.setFixedSize(MENU_BUTTON_SIZE, MENU_BUTTON_SIZE)
+            btn.setStyleSheet(_MENU_BUTTON_QSS)
+            # The glyph is rasterized once instead of being shaped by the font engine on every paint
+            btn.setIcon(self._menu_glyph_icon(glyph, dpr))
+            btn.setIconSize(QtCore.QSize(MENU_GLYPH_SIZE, MENU_GLYPH_SIZE))
             btn.setToolTip(label)
-            btn.clicked.connect(callback)
-            
-            # Calculate position in global coordinates
-            angle_rad = math.radians(angle - 90)  # -90 to start from top
-            x = center_x + radius * math.cos(angle_rad) - 30  # -30 to center button (half of 60)
-            y = center_y + radius * math.sin(angle_rad) - 30
-            
-            btn.move(int(x), int(y))
-            btn.show()
+            btn.clicked.connect(getattr(self, handler))
             self.menu_buttons.append(btn)
 
+    @staticmethod
+    def _menu_glyph_icon(glyph, dpr):
+        """Circular-menu emoji drawn into an icon (rendered once per glyph and pixel ratio)"""
+        key = f"menu_glyph|{glyph}|{dpr}"
+        pix = QtGui.QPixmapCache.find(key)
+        if pix is None or pix.isNull():
+            side = round(MENU_GLYPH_SIZE * dpr)
+            pix = QtGui.QPixmap(side, side)
+            pix.setDevicePixelRatio(dpr)
+            pix.fill(QtCore.Qt.transparent)
+            p = QtGui.QPainter(pix)
+            p.setRenderHint(QtGui.QPainter.RenderHint.TextAntialiasing)
+            font = QtGui.QFont()
+            font.setPixelSize(24)
+            font.setBold(True)
+            p.setFont(font)
+            p.setPen(QtGui.QColor(255, 255, 255))
+            p.drawText(QtCore.QRectF(0, 0, MENU_GLYPH_SIZE, MENU_GLYPH_SIZE), QtCore.Qt.AlignCenter, glyph)
+            p.end()
+            QtGui.QPixmapCache.insert(key, pix)
+        return QtGui.QIcon(pix)
+
     def _hide_circular_menu(self):
-        """Hide and remove circular menu buttons"""
+        """Hide the circular menu buttons (they are kept for the next open)"""
         for btn in self.menu_buttons:
-            btn.close()
-            btn.deleteLater()
-        self.menu_buttons.clear()
+            btn.hide()
         self.menu_visible = False
 
     def _on_prompt_click(self):
@@ -973,41 +1659,36 @@ class FloatingCharacter(QtWidgets.QWidget):
         text = self.show_question_dialog()
         if text:
             self.show_chat_message("Thinking...", duration_ms=1200)
-            QtWidgets.QApplication.processEvents()
-            try:
-                # Send prompt to MCP server's /gemini_chat endpoint
-                mcp_url = "http://127.0.0.1:8576/gemini_chat"
-                payload = {
-                    "prompt": text,
-                    "system_prompt": CONFIG["llm"].get("system_prompt")
-                }
-                response = requests.post(mcp_url, json=payload, timeout=30)
-                if response.status_code == 200:
-                    body = response.json()
-                    progress_messages = body.get("progress_messages", [])
-                    final_reply = body.get("reply", "(No reply)")
-                    session_incomplete = body.get("session_incomplete", False)
-
-                    deduped_messages = []
-                    for msg in progress_messages:
-                        cleaned = (msg or "").strip()
-                        if not cleaned:
-                            continue
-                        if not deduped_messages or deduped_messages[-1] != cleaned:
-                            deduped_messages.append(cleaned)
-
-                    cleaned_final = (final_reply or "").strip() or "(No reply)"
-                    progress_only = [msg for msg in deduped_messages if msg != cleaned_final]
-                    reply = "\n\n".join(progress_only + [cleaned_final])
-
-                    if session_incomplete:
-                        reply = f"{reply}\n\n[Warning] Session ended without explicit stop_session signal."
-                else:
-                    reply = f"Error: MCP server returned status {response.status_code}\n{response.text}"
-            except Exception as e:
-                reply = f"Error contacting MCP server: {e}"
-            self._play_temp_gif("assets/slime-talking.gif", duration_ms=3750)
-            self._show_llm_reply(reply)
+            # Run the MCP round-trip on a worker thread so the UI keeps animating
+            worker = LLMWorker(text, SYSTEM_PROMPT, self)
+            worker.partial.connect(self.show_chat_message)
+            worker.result.connect(self._on_llm_reply)
+            worker.finished.connect(lambda w=worker: self._release_worker(w))
+            self._workers.append(worker)
+            worker.start()
+
+    def _on_llm_reply(self, reply):
+        """Show a reply delivered by an LLMWorker"""
+        self._play_temp_gif("assets/slime-talking.gif", duration_ms=3750)
+        self._show_llm_reply(reply)
+
+    def run_tool(self, category, action, params=None):
+        """Run a tools API call on a worker thread and show its result"""
+        worker = ToolWorker(category, action, params, self)
+        worker.result.connect(self._on_tool_result)
+        worker.finished.connect(lambda w=worker: self._release_worker(w))
+        self._workers.append(worker)
+        worker.start()
+
+    def _on_tool_result(self, message, duration_ms):
+        """Show a result delivered by a ToolWorker"""
+        self.show_chat_message(message, duration_ms=duration_ms or None)
+
+    def _release_worker(self, worker):
+        """Drop a finished worker thread"""
+        if worker in self._workers:
+            self._workers.remove(worker)
+        worker.deleteLater()
 
     def _on_move_click(self):
         """Activate move mode"""
@@ -1032,6 +1713,8 @@ class FloatingCharacter(QtWidgets.QWidget):
         
         if reply == QtWidgets.QMessageBox.Yes:
             try:
+                # psutil is only needed here, so load it on demand
+                import psutil
                 # Find and terminate settings manager
                 current_pid = os.getpid()
                 for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
@@ -1051,11 +1734,17 @@ class FloatingCharacter(QtWidgets.QWidget):
     def _on_tools_click(self):
         """Show tools selection dialog"""
         self._hide_circular_menu()
-        dialog = ToolsDialog(self)
-        dialog.exec()
+        # Built once and reused; shown modeless so the character keeps animating
+        if self._tools_dialog is None:
+            self._tools_dialog = ToolsDialog(self)
+        self._tools_dialog.show()
+        self._tools_dialog.raise_()
+        self._tools_dialog.activateWindow()
 
     def mousePressEvent(self, event: QtGui.QMouseEvent):
         if event.button() == QtCore.Qt.LeftButton:
+            # Settle in place so the menu/drag starts from where the character is
+            self._wander_anim.stop()
             # If menu is visible, clicking anywhere hides it
             if self.menu_visible:
                 self._hide_circular_menu()
@@ -1064,8 +1753,14 @@ class FloatingCharacter(QtWidgets.QWidget):
             # Check if in move mode
             if self.move_mode:
                 self.dragging = True
-                self.last_mouse_pos = event.globalPosition().toPoint()
                 self.setCursor(QtCore.Qt.ClosedHandCursor)
+                handle = self.windowHandle()
+                if handle is not None and handle.startSystemMove():
+                    # The window manager moves the window; no per-event Python work
+                    self._system_move_idle_checks = 0
+                    self._system_move_timer.start()
+                else:
+                    self.last_mouse_pos = event.globalPosition().toPoint()
             else:
                 # Show circular menu
                 self._create_circular_menu()
@@ -1076,17 +1771,59 @@ class FloatingCharacter(QtWidgets.QWidget):
         self.show_chat_message(reply)
 
     def mouseMoveEvent(self, event: QtGui.QMouseEvent):
-        if self.dragging:
-            new_pos = event.globalPosition().toPoint()
-            delta = new_pos - self.last_mouse_pos
-            self.move(self.x() + delta.x(), self.y() + delta.y())
-            self.last_mouse_pos = new_pos
+        # Mouse tracking is left off, so hovering never gets here; only moves with a button held do.
+        # Fallback drag for platforms without startSystemMove()
+        if self.dragging and self.last_mouse_pos is not None:
+            self._pending_drag_pos = event.globalPosition().toPoint()
+            if time.monotonic_ns() - self._last_drag_move_ns >= DRAG_MOVE_INTERVAL_MS * 1_000_000:
+                self._apply_drag()
+            elif not self._drag_flush_timer.isActive():
+                # Lands the last cursor position of the frame even if no further event comes
+                self._drag_flush_timer.start()
             event.accept()
 
+    def _apply_drag(self):
+        """Move the window by the cursor travel since the last applied drag step"""
+        if self._pending_drag_pos is None or self.last_mouse_pos is None:
+            return
+        delta = self._pending_drag_pos - self.last_mouse_pos
+        self.move(self.x() + delta.x(), self.y() + delta.y())
+        self.last_mouse_pos = self._pending_drag_pos
+        self._pending_drag_pos = None
+        self._last_drag_move_ns = time.monotonic_ns()
+
     def mouseReleaseEvent(self, event: QtGui.QMouseEvent):
+        if self.dragging:
+            self._apply_drag()
+            self._finish_drag()
+            event.accept()
+
+    def moveEvent(self, event: QtGui.QMoveEvent):
+        # Each native-drag step pushes back the "drag finished" check
+        if self._system_move_timer.isActive():
+            self._system_move_idle_checks = 0
+            self._system_move_timer.start()
+        return super().moveEvent(event)
+
+    def _on_system_move_settled(self):
+        if not self.dragging:
+            return
+        # Button still held: the user is pausing mid-drag. Some window managers swallow
+        # the release, so a long enough pause ends the drag regardless.
+        self._system_move_idle_checks += 1
+        held = QtGui.QGuiApplication.mouseButtons() & QtCore.Qt.LeftButton
+        if held and self._system_move_idle_checks < SYSTEM_MOVE_MAX_IDLE_CHECKS:
+            self._system_move_timer.start()
+            return
+        self._finish_drag()
+
+    def _finish_drag(self):
+        self._system_move_timer.stop()
+        self._drag_flush_timer.stop()
         if self.dragging:
             self.dragging = False
             self.last_mouse_pos = None
+            self._pending_drag_pos = None
             
             if self.move_mode:
                 # Ask if user wants to disable move mode after dragging
@@ -1103,36 +1840,63 @@ class FloatingCharacter(QtWidgets.QWidget):
                 else:
                     # Keep move mode active
                     self.setCursor(QtCore.Qt.OpenHandCursor)
-            event.accept()
+
+    @staticmethod
+    def _build_wander_table():
+        """
+        Precompute a batch of wander steps so ticks make no trig or RNG calls.
+
+        Each entry is (vx, vy, pick, reverse, stop): a candidate velocity and the
+        three per-tick decisions (60% take the new velocity, 10% reverse, 5% stop).
+        """
+        table = []
+        rand = random.random
+        for _ in range(WANDER_TABLE_SIZE):
+            ang = random.uniform(0, 2 * math.pi)
+            speed = random.uniform(0.75, 1.5) * MOVE_STEP
+            table.append((
+                int(speed * math.cos(ang)), int(speed * math.sin(ang)),
+                rand() < 0.6, rand() < 0.1, rand() < 0.05,
+            ))
+        return table
 
     def _wander_step(self):
-        if self.dragging or not self.isVisible() or self.move_mode or self.menu_visible:
+        if self.dragging or not self.isVisible() or self.isMinimized() or self.move_mode or self.menu_visible:
             return
-        geom = QtWidgets.QApplication.primaryScreen().availableGeometry()
+        min_x, max_x, min_y, max_y = self._wander_bounds
         x, y = self.x(), self.y()
 
+        i = self._wander_index
+        vx, vy, pick, reverse, stop = self._wander_table[i]
+        self._wander_index = (i + 1) & (WANDER_TABLE_SIZE - 1)
+        if self._wander_index == 0:
+            # Refill after a full pass so the path does not repeat
+            self._wander_table = self._build_wander_table()
         # More frequent and visible randomization
-        if random.random() < 0.6:
-            ang = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(0.75, 1.5) * MOVE_STEP
-            self.vx = int(speed * math.cos(ang))
-            self.vy = int(speed * math.sin(ang))
+        if pick:
+            self.vx, self.vy = vx, vy
         # Occasionally stop or reverse
-        if random.random() < 0.1:
+        if reverse:
             self.vx = -self.vx
             self.vy = -self.vy
-        if random.random() < 0.05:
+        if stop:
             self.vx = 0
             self.vy = 0
 
         nx = x + self.vx
         ny = y + self.vy
 
-        nx = max(geom.left(), min(nx, geom.right() - self.width()))
-        ny = max(geom.top(), min(ny, geom.bottom() - self.height()))
-
-        self.move(nx, ny)
-        self._play_temp_gif("assets/slime-jump.gif", duration_ms=1250)
+        nx = min_x if nx < min_x else max_x if nx > max_x else nx
+        ny = min_y if ny < min_y else max_y if ny > max_y else ny
+
+        # The jump pauses wander_timer until it ends, so it must not outlast the configured interval
+        duration = min(WANDER_ANIMATION_MS, self.wander_timer.interval())
+        self._wander_anim.stop()
+        self._wander_anim.setDuration(duration)
+        self._wander_anim.setStartValue(QtCore.QPoint(x, y))
+        self._wander_anim.setEndValue(QtCore.QPoint(nx, ny))
+        self._wander_anim.start()
+        self._play_temp_gif("assets/slime-jump.gif", duration_ms=duration)
 
 def main():
     app = QtWidgets.QApplication([])
@@ -17,9 +17,7 @@ Requirements:
 import sys
 import json
 import os
-import psutil
 import subprocess
-import requests
 import time
 import logging
 from pathlib import Path
@@ -674,6 +672,8 @@ class SettingsManager(QMainWindow):
                     self.running_process = None
                 
                 # Also try to find and kill any character_UI.py processes
+                # (psutil is only needed on these stop paths, so load it on demand)
+                import psutil
                 current_pid = os.getpid()
                 for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
                     try:
@@ -709,6 +709,8 @@ class SettingsManager(QMainWindow):
     
     def is_tool_server_running(self):
         """Check if the tool server is running by making a health check request"""
+        # requests is only needed once the app is launched or stopped, so load it on demand
+        import requests
         try:
             response = requests.get(f"{TOOL_SERVER_URL}/", timeout=10)
             
@@ -797,6 +799,7 @@ class SettingsManager(QMainWindow):
         try:
             # First, ask the server to clean up its own processes (like WhatsApp Node.js)
             try:
+                import requests
                 requests.post(f"{TOOL_SERVER_URL}/tools/shutdown", timeout=5)
             except Exception:
                 pass  # Server might already be down
@@ -814,6 +817,7 @@ class SettingsManager(QMainWindow):
                 self.tool_server_process = None
             
             # Also kill any orphaned uvicorn processes for tools_app
+            import psutil
             current_pid = os.getpid()
             for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
                 try: